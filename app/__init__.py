@@ -1,6 +1,9 @@
 from flask import Flask
 
 def create_app():
+    from .logging_config import configure_logging
+    configure_logging()
+
     app = Flask(__name__)
     
     # Load configuration
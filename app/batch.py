@@ -0,0 +1,104 @@
+from typing import Callable, Iterator, Optional, Tuple
+
+import numpy as np
+
+from app.frequency_model import as_frequency_model
+
+# Tickets generated per vectorized pass; bounds memory for very large batches.
+BATCH_CHUNK_SIZE = 4096
+
+
+def generate_ticket_batch(draw_frequencies, count: int, rng: Optional[np.random.Generator] = None,
+                          top_count=14, lucky_count=7, bottom_count=5, range_=49,
+                          chaos_count=5, pick_count=6) -> np.ndarray:
+    """Generate ``count`` PEN tickets in one vectorized pass.
+
+    Mirrors ``generate_pen_lotto_numbers`` row by row: lucky numbers are a
+    random ``lucky_count`` of the ``top_count`` most frequent balls, underdogs
+    are the ``bottom_count`` least frequent, chaos numbers are uniform draws
+    from 1..``range_``. Each ticket then takes two lucky numbers, one multiple
+    of 7 from the underdog/chaos pool when available, and fills up to
+    ``pick_count`` unique balls from everything left. Returns an int array of
+    shape ``(count, pick_count)``.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    model = as_frequency_model(draw_frequencies)
+    if len(model) < pick_count:
+        raise ValueError(f"Not enough draw frequencies to build {pick_count}-ball tickets.")
+    top = np.asarray(model.top(top_count), dtype=np.int64)
+    bottom = np.asarray(model.bottom(bottom_count), dtype=np.int64)
+    width = max(range_, int(top.max(initial=0)), int(bottom.max(initial=0))) + 1
+    rows = np.arange(count)[:, None]
+
+    # Lucky Echo Bias: a random lucky_count-subset of the top numbers per row.
+    lucky = top[np.argsort(rng.random((count, top.size), dtype=np.float32), axis=1)[:, :lucky_count]]
+    # Chaos Jitter, with replacement like random.randint.
+    chaotic = rng.integers(1, range_ + 1, size=(count, chaos_count))
+
+    numbers_mask = np.zeros((count, width), dtype=bool)
+    numbers_mask[rows, chaotic] = True
+    numbers_mask[:, bottom] = True
+    lucky_mask = np.zeros((count, width), dtype=bool)
+    lucky_mask[rows, lucky] = True
+
+    # Universal balance: two lucky numbers first (already in random order).
+    chosen = lucky[:, :2]
+    taken = np.zeros((count, width), dtype=bool)
+    taken[rows, chosen] = True
+
+    # One multiple of 7 from the chaos/underdog pool, if any.
+    multiples = np.zeros(width, dtype=bool)
+    multiples[7::7] = True
+    candidates = numbers_mask & multiples & ~taken
+    keys = np.where(candidates, rng.random((count, width), dtype=np.float32), np.inf)
+    seventh = np.argmin(keys, axis=1)
+    has_seventh = candidates.any(axis=1)
+    taken[has_seventh, seventh[has_seventh]] = True
+
+    # Fill the rest uniformly from whatever is left in the combined pool.
+    remaining = (numbers_mask | lucky_mask) & ~taken
+    keys = np.where(remaining, rng.random((count, width), dtype=np.float32), np.inf)
+    fill = np.argsort(keys, axis=1)[:, :pick_count - 2]
+
+    tickets = np.empty((count, pick_count), dtype=np.int64)
+    tickets[:, :2] = chosen
+    tickets[:, 2] = np.where(has_seventh, seventh, fill[:, 0])
+    tickets[:, 3:] = np.where(has_seventh[:, None], fill[:, :pick_count - 3], fill[:, 1:pick_count - 2])
+    return tickets
+
+
+def iter_ticket_batches(draw_frequencies, count: int, rng: Optional[np.random.Generator] = None,
+                        chunk_size: int = BATCH_CHUNK_SIZE, bonus_range: int = 0,
+                        accept: Optional[Callable[[np.ndarray], np.ndarray]] = None, redraws: int = 0,
+                        **kwargs) -> Iterator[Tuple[np.ndarray, Optional[np.ndarray]]]:
+    """Yield ``count`` tickets as ``(tickets, bonus)`` chunks of at most ``chunk_size`` rows.
+
+    ``bonus`` holds one uniform draw from 1..``bonus_range`` per ticket, or
+    is None for games without a bonus ball. ``accept`` maps a ticket array to
+    a boolean array of rows to keep (e.g. ``IssuedTickets.add_many``);
+    rejected rows are re-drawn up to ``redraws`` times. Input is validated
+    eagerly so errors surface before streaming starts.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    model = as_frequency_model(draw_frequencies)
+    pick_count = kwargs.get("pick_count", 6)
+    if len(model) < pick_count:
+        raise ValueError(f"Not enough draw frequencies to build {pick_count}-ball tickets.")
+
+    def chunks(remaining):
+        while remaining > 0:
+            size = min(remaining, chunk_size)
+            tickets = generate_ticket_batch(model, size, rng=rng, **kwargs)
+            if accept is not None:
+                keep = accept(tickets)
+                for _ in range(redraws):
+                    retry = np.flatnonzero(~keep)
+                    if not retry.size:
+                        break
+                    tickets[retry] = generate_ticket_batch(model, retry.size, rng=rng, **kwargs)
+                    keep[retry] = accept(tickets[retry])
+            bonus = rng.integers(1, bonus_range + 1, size=size) if bonus_range else None
+            yield tickets, bonus
+            remaining -= size
+
+    return chunks(count)
@@ -0,0 +1,175 @@
+import os
+import re
+import logging
+from html.parser import HTMLParser
+from typing import Dict, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Extraction backend for the hot-numbers page: "fast" (event-based) or "soup".
+EXTRACTOR = os.environ.get("EXTRACTOR", "fast")
+
+CELL_CLASS = "tableCell centred fluid"
+BALL_CLASS = "ball lotto ball"
+JACKPOT_CLASS = "jackpotTxt"
+
+
+class ExtractionRules(NamedTuple):
+    """Classes identifying frequency cells, their ball and the jackpot on a page."""
+    cell_class: str = CELL_CLASS
+    ball_class: str = BALL_CLASS
+    jackpot_class: str = JACKPOT_CLASS
+
+
+DEFAULT_RULES = ExtractionRules()
+
+DrawData = Tuple[Dict[int, int], Optional[str]]
+
+
+def _clean_jackpot(text: str) -> str:
+    return re.sub(r"\s+", " ", text.strip())
+
+
+def _cells_to_frequencies(cells) -> Dict[int, int]:
+    frequencies = {}
+    for ball_text, drawn_text in cells:
+        try:
+            frequencies[int(ball_text.strip())] = int(drawn_text.strip())
+        except (ValueError, AttributeError):
+            logger.warning("Skipped malformed cell during scraping.")
+    return frequencies
+
+
+def extract_with_soup(html_content: str, rules: ExtractionRules = DEFAULT_RULES) -> DrawData:
+    """Reference extractor that builds a full BeautifulSoup tree."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html_content, "html.parser")
+
+    table_cells = soup.find_all("div", class_=rules.cell_class)
+    if not table_cells:
+        raise ValueError("Unable to find table cells for lotto numbers.")
+
+    cells = []
+    for cell in table_cells:
+        ball = cell.find("div", class_=rules.ball_class)
+        strong = cell.find("strong")
+        cells.append((ball.text if ball else None, strong.text if strong else None))
+
+    jackpot_element = soup.find("span", class_=rules.jackpot_class)
+    jackpot = _clean_jackpot(jackpot_element.text) if jackpot_element else None
+    return _cells_to_frequencies(cells), jackpot
+
+
+class _HotNumbersParser(HTMLParser):
+    """Streaming parser that only tracks the few elements we read.
+
+    No tree is built: it keeps nesting depths for the current frequency cell,
+    its ball div and drawn-count <strong>, and the jackpot span, and collects
+    their text as it streams past.
+    """
+
+    def __init__(self, rules: ExtractionRules = DEFAULT_RULES):
+        super().__init__(convert_charrefs=True)
+        self.rules = rules
+        self.cells = []
+        self.jackpot = None
+        self._cell = None
+        self._cell_depth = 0
+        self._ball_depth = 0
+        self._strong_depth = 0
+        self._span_depth = 0
+        self._jackpot_parts = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "div":
+            if self._cell is not None:
+                self._cell_depth += 1
+                if self._cell[0] is None and _class_of(attrs) == self.rules.ball_class:
+                    self._cell[0] = []
+                    self._ball_depth = self._cell_depth
+            elif _class_of(attrs) == self.rules.cell_class:
+                self._cell = [None, None]
+                self._cell_depth = 1
+        elif tag == "strong" and self._cell is not None:
+            if self._strong_depth:
+                self._strong_depth += 1
+            elif self._cell[1] is None:
+                self._cell[1] = []
+                self._strong_depth = 1
+        elif tag == "span":
+            if self._span_depth:
+                self._span_depth += 1
+            elif self.jackpot is None and self._jackpot_parts is None:
+                cls = _class_of(attrs)
+                if cls and self.rules.jackpot_class in cls.split():
+                    self._jackpot_parts = []
+                    self._span_depth = 1
+
+    def handle_endtag(self, tag):
+        if tag == "div" and self._cell is not None:
+            if self._ball_depth == self._cell_depth:
+                self._ball_depth = 0
+            self._cell_depth -= 1
+            if self._cell_depth == 0:
+                ball, drawn = self._cell
+                self.cells.append((
+                    "".join(ball) if ball is not None else None,
+                    "".join(drawn) if drawn is not None else None,
+                ))
+                self._cell = None
+                self._strong_depth = 0
+        elif tag == "strong" and self._strong_depth:
+            self._strong_depth -= 1
+        elif tag == "span" and self._span_depth:
+            self._span_depth -= 1
+            if not self._span_depth:
+                self.jackpot = _clean_jackpot("".join(self._jackpot_parts))
+
+    def handle_data(self, data):
+        if self._ball_depth:
+            self._cell[0].append(data)
+        if self._strong_depth:
+            self._cell[1].append(data)
+        if self._span_depth:
+            self._jackpot_parts.append(data)
+
+
+def _class_of(attrs) -> Optional[str]:
+    for name, value in attrs:
+        if name == "class":
+            return value
+    return None
+
+
+def extract_fast(html_content: str, rules: ExtractionRules = DEFAULT_RULES) -> DrawData:
+    """Event-based extractor; same output as ``extract_with_soup``."""
+    parser = _HotNumbersParser(rules)
+    parser.feed(html_content)
+    parser.close()
+    if not parser.cells:
+        raise ValueError("Unable to find table cells for lotto numbers.")
+    return _cells_to_frequencies(parser.cells), parser.jackpot
+
+
+EXTRACTORS = {
+    "fast": extract_fast,
+    "soup": extract_with_soup,
+}
+
+
+def extract_draw_data(html_content: str, backend: str = None,
+                      rules: ExtractionRules = DEFAULT_RULES) -> DrawData:
+    """Extract ``(frequencies, jackpot)`` using the configured backend.
+
+    Any failure of a non-soup backend falls back to BeautifulSoup.
+    """
+    backend = backend or EXTRACTOR
+    extractor = EXTRACTORS.get(backend, extract_with_soup)
+    if extractor is extract_with_soup:
+        return extract_with_soup(html_content, rules)
+    try:
+        return extractor(html_content, rules)
+    except Exception as e:
+        logger.warning("%s extractor failed (%s); falling back to BeautifulSoup.", backend, e)
+        return extract_with_soup(html_content, rules)
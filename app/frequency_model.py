@@ -0,0 +1,59 @@
+from array import array
+from collections.abc import Mapping
+from typing import Iterator, List
+
+
+class FrequencyModel(Mapping):
+    """Read-only ball -> draw count view with precomputed rank orders.
+
+    Built once per snapshot so selection code can take top-k/bottom-k slices
+    in O(k) instead of sorting the frequencies on every ticket. Counts live in
+    an array indexed by ball number (-1 marks a ball missing from the page).
+    Tie order matches ``sorted(..., key=count)`` over the source mapping.
+    """
+
+    __slots__ = ("_counts", "_balls", "descending", "ascending")
+
+    def __init__(self, frequencies: Mapping):
+        items = list(frequencies.items())
+        size = max((ball for ball, _ in items), default=0) + 1
+        self._counts = array("l", [-1]) * size
+        for ball, count in items:
+            self._counts[ball] = count
+        self._balls = tuple(sorted(ball for ball, _ in items))
+        self.descending = tuple(
+            ball for ball, _ in sorted(items, key=lambda item: item[1], reverse=True))
+        self.ascending = tuple(
+            ball for ball, _ in sorted(items, key=lambda item: item[1]))
+
+    def top(self, k: int) -> List[int]:
+        """The k most frequently drawn balls, most frequent first."""
+        return list(self.descending[:k])
+
+    def bottom(self, k: int) -> List[int]:
+        """The k least frequently drawn balls, least frequent first."""
+        return list(self.ascending[:k])
+
+    def __getitem__(self, ball: int) -> int:
+        if not isinstance(ball, int) or not 0 <= ball < len(self._counts) or self._counts[ball] < 0:
+            raise KeyError(ball)
+        return self._counts[ball]
+
+    def __contains__(self, ball) -> bool:
+        return isinstance(ball, int) and 0 <= ball < len(self._counts) and self._counts[ball] >= 0
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._balls)
+
+    def __len__(self) -> int:
+        return len(self._balls)
+
+    def __repr__(self) -> str:
+        return f"FrequencyModel({dict(self)!r})"
+
+
+def as_frequency_model(draw_frequencies: Mapping) -> FrequencyModel:
+    """Return ``draw_frequencies`` as a FrequencyModel, building one if needed."""
+    if isinstance(draw_frequencies, FrequencyModel):
+        return draw_frequencies
+    return FrequencyModel(draw_frequencies)
@@ -1,110 +1,111 @@
 import random
 
+FUN_FACTS = (
+    "Today's values are derived from 42, the answer to life, the universe, and everything, according to Deep Thought.",
+    "Lotto numbers are more about luck than any algorithm, but we try anyway!",
+    "Did you know? The most common lotto number is 7, but that doesn't mean you'll win!",
+    "Some say the stars influence our fate... we prefer algorithms!",
+    "Our numbers are generated with chaos and balance-kind of like your life.",
+    "The universe is random, and so are these numbers. Good luck!",
+    "Lotto is a game of chance, and these numbers are your companions in the journey.",
+    "We chose random as our favorite number, but the universe disagrees!",
+    "Remember: It's not about winning, it's about having fun... and maybe losing money!",
+    "Our algorithm is more complex than a magician's trick, but the result is just as random.",
+    "Hogwash frequency analysis ensures we're absolutely uncertain in the most predictable way possible.",
+    "Today's numbers are brought to you by random chance and mild confusion.",
+    "Sometimes the algorithm forgets it's not human and picks the same number twice. Whoops!",
+    "The most random number of all is the one we haven't picked yet!",
+    "Lotto numbers are so random, they could have been generated by a pigeon wearing a blindfold.",
+    "The algorithm is like a squirrel in a maze, running in circles until it finds the exit... or not.",
+    "Our pseudo-random generator tries to guess the future based on the past, but it's like using a map in the dark.",
+    "Frequency analysis tells us what numbers might come up, but it's still like picking a star from the sky.",
+    "Even our random generator has a favorite number... but it refuses to admit it.",
+    "The universe is full of mysteries, but these numbers are definitely one of them.",
+    "We balance randomness with careful guesswork to create the perfect lotto chaos.",
+    "One day, the algorithm might stop working, but today is not that day. Or is it?",
+    "The algorithm's favorite sport is randomly choosing lotto numbers. It's undefeated.",
+    "What if numbers are just metaphors for our existence? Or maybe they're just random.",
+    "Balance is key: we like to ensure that every number has its turn in the spotlight.",
+    "It's not about the algorithm; it's about the magic of randomness.",
+    "The real trick is not getting caught up in the frequency analysis... but we still do.",
+    "Today's numbers were plucked out of the chaotic ether, like a leaf on the wind.",
+    "Lotto numbers are unpredictable. Unless you can predict them, in which case, you're probably a wizard.",
+    "Our algorithm isn't superstitious, but it does have a lucky number. Don't ask us which one.",
+    "We've applied advanced probability to these numbers... kind of. Mostly, we just hope for the best.",
+    "Sometimes, the best number is the one you least expect. Or is it?",
+    "Our numbers are like a broken clock-accurate twice a day, completely random the rest of the time.",
+    "If randomness had a shape, it would look a lot like these numbers.",
+    "Just like a deck of cards, every lotto number has its moment in the game.",
+    "The most surprising thing about these numbers? They're all chosen by random algorithms... and a dash of chaos.",
+    "You can't predict the future, but with this algorithm, we can at least guess.",
+    "Today's number sequence is brought to you by entropy and the occasional roll of the dice.",
+    "In a world of chaos, these numbers offer a rare moment of... more chaos.",
+    "The algorithm's favorite pastime? Generating numbers that don't seem to follow any rules.",
+    "Did you know? The most random numbers in the world are probably the ones that haven't been picked yet.",
+    "Every time the algorithm generates numbers, a little piece of the universe shudders.",
+    "The numbers you see are like ancient runes... but with less ancient and more random.",
+    "Hogwash frequency analysis means we're just guessing, but with more fancy words.",
+    "Our algorithm is a bit like a lottery-winning fish: it tries really hard, but it's still in the ocean.",
+    "Today's winning numbers are as random as your last email password.",
+    "Lotto numbers are like pizza-everyone has their favorite, but they're still all dough and cheese at the end of the day.",
+    "Sometimes the algorithm gets a little carried away and generates way too many numbers. Sorry about that.",
+    "A balanced lotto number sequence is like a perfect sandwich: hard to make, even harder to predict.",
+    "The algorithm doesn't always get it right, but at least it's consistently unpredictable.",
+    "In the world of randomness, these numbers stand out... mostly because they're random.",
+    "Every time the algorithm generates numbers, somewhere in the world, a butterfly flaps its wings.",
+    "This algorithm might be pseudo-random, but it's definitely not boring.",
+    "Balance is the key to a successful lotto prediction, or so the algorithm says.",
+    "Chaos is just another word for 'unexpected.' We prefer the term 'lotto.'",
+    "Today's numbers are brought to you by random choice and a sprinkle of good fortune.",
+    "The universe might not always align, but these numbers sure do try.",
+    "Lotto numbers are more like abstract art. You may not understand them, but they look great on paper.",
+    "There's nothing random about the feeling of excitement when your numbers are drawn.",
+    "Lotto is all about chance. Our algorithm just helps to stack the odds in your favor... kinda.",
+    "Just when you think you've seen every possible number combo, the algorithm throws in a curveball.",
+    "Did you know? Every time the algorithm runs, it generates a million new possibilities. Just for you!",
+    "Randomness is not without its method, and that method is... well, random.",
+    "Our numbers are generated like a cosmic lottery. Just without the cosmic part.",
+    "The lotto algorithm can be unpredictable, but it's always entertaining.",
+    "Today's numbers were created with a dash of randomness and a pinch of hope.",
+    "In the world of lotto, nothing is truly random-except for the numbers we generate.",
+    "Our pseudo-random generator doesn't believe in fate, but it does believe in generating numbers.",
+    "The numbers today are brought to you by algorithms, chaos, and a little luck.",
+    "What happens when you combine hogwash frequency analysis and pseudo-random generation? These numbers.",
+    "You can't predict the future, but we sure can guess the numbers... sometimes.",
+    "The numbers generated here are 100% random. Unless you count the algorithm.",
+    "Lotto is like life-full of surprises, and these numbers prove it.",
+    "Today's lotto numbers are as random as your last attempt at a New Year's resolution.",
+    "We don't control the randomness; we just help it along with some fancy algorithms.",
+    "Randomness is both beautiful and terrifying. Just like the lotto.",
+    "If you were expecting the algorithm to make perfect sense, you might want to adjust your expectations.",
+    "Today's numbers were not chosen by a magic genie, but they may as well have been.",
+    "Lotto numbers are like fingerprints-no two sets are ever the same.",
+    "Every time we generate numbers, it's like rolling a dice in the multiverse.",
+    "The most predictable thing about these numbers? They're entirely unpredictable.",
+    "In the great game of life and lotto, we're all just trying to beat the odds. Good luck!",
+    "The beauty of lotto numbers lies in their complete unpredictability. Embrace the chaos!",
+    "Lotto is just a game, but our algorithm tries to make it a fun one.",
+    "Today's lotto sequence was brought to you by randomness and probability theory.",
+    "Every time we generate numbers, a new possibility is born. Who knows what'll happen next?",
+    "We balance randomness and strategy like a perfectly brewed cup of coffee.",
+    "The algorithm knows one thing: It doesn't know anything. Hence, the randomness.",
+    "If lotto numbers were songs, today's would be a chaotic symphony.",
+    "Some people say the lottery is about luck, but our algorithm just adds more luck.",
+    "Randomness and frequency analysis are like chocolate and peanut butter-great when mixed together.",
+    "The numbers might not make sense, but they sure do look pretty on a ticket.",
+    "Today's numbers were randomly selected, but that doesn't mean they won't be perfect for you!",
+    "Lotto predictions are just random guesses, with a little bit of science mixed in.",
+    "We try to balance the odds. The algorithm just picks numbers, and we hope for the best.",
+    "The only thing predictable about these numbers is how unpredictable they are.",
+    "Randomness and lotto go hand in hand. That's why we love it so much.",
+    "Today's numbers were chosen with one goal in mind: randomness. And it works every time.",
+    "Our numbers are so random, they could be the last piece in a 1000-piece puzzle.",
+    "The lotto algorithm is like a box of chocolates-except there's no guarantee you'll get what you want.",
+    "You can't control randomness, but you can definitely enjoy the ride.",
+    "Today's lotto sequence was brought to you by probability and a sprinkle of chaos.",
+    "In the grand lottery of life, these numbers are just a small, unpredictable part of the journey."
+)
 
-def get_random_fun_fact():
-    fun_facts = [
-        "Today's values are derived from 42, the answer to life, the universe, and everything, according to Deep Thought.",
-        "Lotto numbers are more about luck than any algorithm, but we try anyway!",
-        "Did you know? The most common lotto number is 7, but that doesn't mean you'll win!",
-        "Some say the stars influence our fate... we prefer algorithms!",
-        "Our numbers are generated with chaos and balance-kind of like your life.",
-        "The universe is random, and so are these numbers. Good luck!",
-        "Lotto is a game of chance, and these numbers are your companions in the journey.",
-        "We chose random as our favorite number, but the universe disagrees!",
-        "Remember: It's not about winning, it's about having fun... and maybe losing money!",
-        "Our algorithm is more complex than a magician's trick, but the result is just as random.",
-        "Hogwash frequency analysis ensures we're absolutely uncertain in the most predictable way possible.",
-        "Today's numbers are brought to you by random chance and mild confusion.",
-        "Sometimes the algorithm forgets it's not human and picks the same number twice. Whoops!",
-        "The most random number of all is the one we haven't picked yet!",
-        "Lotto numbers are so random, they could have been generated by a pigeon wearing a blindfold.",
-        "The algorithm is like a squirrel in a maze, running in circles until it finds the exit... or not.",
-        "Our pseudo-random generator tries to guess the future based on the past, but it's like using a map in the dark.",
-        "Frequency analysis tells us what numbers might come up, but it's still like picking a star from the sky.",
-        "Even our random generator has a favorite number... but it refuses to admit it.",
-        "The universe is full of mysteries, but these numbers are definitely one of them.",
-        "We balance randomness with careful guesswork to create the perfect lotto chaos.",
-        "One day, the algorithm might stop working, but today is not that day. Or is it?",
-        "The algorithm's favorite sport is randomly choosing lotto numbers. It's undefeated.",
-        "What if numbers are just metaphors for our existence? Or maybe they're just random.",
-        "Balance is key: we like to ensure that every number has its turn in the spotlight.",
-        "It's not about the algorithm; it's about the magic of randomness.",
-        "The real trick is not getting caught up in the frequency analysis... but we still do.",
-        "Today's numbers were plucked out of the chaotic ether, like a leaf on the wind.",
-        "Lotto numbers are unpredictable. Unless you can predict them, in which case, you're probably a wizard.",
-        "Our algorithm isn't superstitious, but it does have a lucky number. Don't ask us which one.",
-        "We've applied advanced probability to these numbers... kind of. Mostly, we just hope for the best.",
-        "Sometimes, the best number is the one you least expect. Or is it?",
-        "Our numbers are like a broken clock-accurate twice a day, completely random the rest of the time.",
-        "If randomness had a shape, it would look a lot like these numbers.",
-        "Just like a deck of cards, every lotto number has its moment in the game.",
-        "The most surprising thing about these numbers? They're all chosen by random algorithms... and a dash of chaos.",
-        "You can't predict the future, but with this algorithm, we can at least guess.",
-        "Today's number sequence is brought to you by entropy and the occasional roll of the dice.",
-        "In a world of chaos, these numbers offer a rare moment of... more chaos.",
-        "The algorithm's favorite pastime? Generating numbers that don't seem to follow any rules.",
-        "Did you know? The most random numbers in the world are probably the ones that haven't been picked yet.",
-        "Every time the algorithm generates numbers, a little piece of the universe shudders.",
-        "The numbers you see are like ancient runes... but with less ancient and more random.",
-        "Hogwash frequency analysis means we're just guessing, but with more fancy words.",
-        "Our algorithm is a bit like a lottery-winning fish: it tries really hard, but it's still in the ocean.",
-        "Today's winning numbers are as random as your last email password.",
-        "Lotto numbers are like pizza-everyone has their favorite, but they're still all dough and cheese at the end of the day.",
-        "Sometimes the algorithm gets a little carried away and generates way too many numbers. Sorry about that.",
-        "A balanced lotto number sequence is like a perfect sandwich: hard to make, even harder to predict.",
-        "The algorithm doesn't always get it right, but at least it's consistently unpredictable.",
-        "In the world of randomness, these numbers stand out... mostly because they're random.",
-        "Every time the algorithm generates numbers, somewhere in the world, a butterfly flaps its wings.",
-        "This algorithm might be pseudo-random, but it's definitely not boring.",
-        "Balance is the key to a successful lotto prediction, or so the algorithm says.",
-        "Chaos is just another word for 'unexpected.' We prefer the term 'lotto.'",
-        "Today's numbers are brought to you by random choice and a sprinkle of good fortune.",
-        "The universe might not always align, but these numbers sure do try.",
-        "Lotto numbers are more like abstract art. You may not understand them, but they look great on paper.",
-        "There's nothing random about the feeling of excitement when your numbers are drawn.",
-        "Lotto is all about chance. Our algorithm just helps to stack the odds in your favor... kinda.",
-        "Just when you think you've seen every possible number combo, the algorithm throws in a curveball.",
-        "Did you know? Every time the algorithm runs, it generates a million new possibilities. Just for you!",
-        "Randomness is not without its method, and that method is... well, random.",
-        "Our numbers are generated like a cosmic lottery. Just without the cosmic part.",
-        "The lotto algorithm can be unpredictable, but it's always entertaining.",
-        "Today's numbers were created with a dash of randomness and a pinch of hope.",
-        "In the world of lotto, nothing is truly random-except for the numbers we generate.",
-        "Our pseudo-random generator doesn't believe in fate, but it does believe in generating numbers.",
-        "The numbers today are brought to you by algorithms, chaos, and a little luck.",
-        "What happens when you combine hogwash frequency analysis and pseudo-random generation? These numbers.",
-        "You can't predict the future, but we sure can guess the numbers... sometimes.",
-        "The numbers generated here are 100% random. Unless you count the algorithm.",
-        "Lotto is like life-full of surprises, and these numbers prove it.",
-        "Today's lotto numbers are as random as your last attempt at a New Year's resolution.",
-        "We don't control the randomness; we just help it along with some fancy algorithms.",
-        "Randomness is both beautiful and terrifying. Just like the lotto.",
-        "If you were expecting the algorithm to make perfect sense, you might want to adjust your expectations.",
-        "Today's numbers were not chosen by a magic genie, but they may as well have been.",
-        "Lotto numbers are like fingerprints-no two sets are ever the same.",
-        "Every time we generate numbers, it's like rolling a dice in the multiverse.",
-        "The most predictable thing about these numbers? They're entirely unpredictable.",
-        "In the great game of life and lotto, we're all just trying to beat the odds. Good luck!",
-        "The beauty of lotto numbers lies in their complete unpredictability. Embrace the chaos!",
-        "Lotto is just a game, but our algorithm tries to make it a fun one.",
-        "Today's lotto sequence was brought to you by randomness and probability theory.",
-        "Every time we generate numbers, a new possibility is born. Who knows what'll happen next?",
-        "We balance randomness and strategy like a perfectly brewed cup of coffee.",
-        "The algorithm knows one thing: It doesn't know anything. Hence, the randomness.",
-        "If lotto numbers were songs, today's would be a chaotic symphony.",
-        "Some people say the lottery is about luck, but our algorithm just adds more luck.",
-        "Randomness and frequency analysis are like chocolate and peanut butter-great when mixed together.",
-        "The numbers might not make sense, but they sure do look pretty on a ticket.",
-        "Today's numbers were randomly selected, but that doesn't mean they won't be perfect for you!",
-        "Lotto predictions are just random guesses, with a little bit of science mixed in.",
-        "We try to balance the odds. The algorithm just picks numbers, and we hope for the best.",
-        "The only thing predictable about these numbers is how unpredictable they are.",
-        "Randomness and lotto go hand in hand. That's why we love it so much.",
-        "Today's numbers were chosen with one goal in mind: randomness. And it works every time.",
-        "Our numbers are so random, they could be the last piece in a 1000-piece puzzle.",
-        "The lotto algorithm is like a box of chocolates-except there's no guarantee you'll get what you want.",
-        "You can't control randomness, but you can definitely enjoy the ride.",
-        "Today's lotto sequence was brought to you by probability and a sprinkle of chaos.",
-        "In the grand lottery of life, these numbers are just a small, unpredictable part of the journey."
-    ]
-    return random.choice(fun_facts)
+
+def get_random_fun_fact(rng=random):
+    return rng.choice(FUN_FACTS)
@@ -0,0 +1,72 @@
+import os
+from dataclasses import dataclass
+from datetime import time
+from typing import Dict, Tuple
+
+from app.extract import CELL_CLASS, JACKPOT_CLASS, ExtractionRules
+from app.schedule import DRAW_TIMES
+
+# Game served by the unsuffixed routes (/generate, /generate/batch, ...).
+DEFAULT_GAME = "lotto"
+
+
+@dataclass(frozen=True)
+class Game:
+    """Static description of one lottery game.
+
+    ``ball_range`` and ``pick_count`` describe the main draw; games with a
+    separately drawn bonus ball (PowerBall) set ``bonus_range``. The
+    ``*_class`` fields are the upstream page's extraction rules, the
+    ``*_count`` fields size the PEN stages for this game, and ``draw_times``
+    are its (weekday, SAST time) draws for ``app.schedule``.
+    """
+    key: str
+    name: str
+    url: str
+    ball_range: int
+    pick_count: int
+    ball_class: str
+    bonus_range: int = 0
+    cell_class: str = CELL_CLASS
+    jackpot_class: str = JACKPOT_CLASS
+    top_count: int = 14
+    lucky_count: int = 7
+    bottom_count: int = 5
+    chaos_count: int = 5
+    draw_times: Tuple[Tuple[int, time], ...] = DRAW_TIMES
+
+    @property
+    def rules(self) -> ExtractionRules:
+        return ExtractionRules(self.cell_class, self.ball_class, self.jackpot_class)
+
+
+def _url(env_name: str, path: str) -> str:
+    return os.environ.get(env_name, f"https://za.national-lottery.com/{path}/hot-numbers")
+
+
+GAMES: Dict[str, Game] = {game.key: game for game in (
+    Game("lotto", "Lotto", _url("LOTTO_URL", "lotto"),
+         ball_range=49, pick_count=6, ball_class="ball lotto ball"),
+    Game("lotto-plus", "Lotto Plus", _url("LOTTO_PLUS_URL", "lotto-plus-1"),
+         ball_range=49, pick_count=6, ball_class="ball lotto-plus-1 ball"),
+    Game("powerball", "PowerBall", _url("POWERBALL_URL", "powerball"),
+         ball_range=50, pick_count=5, bonus_range=20, ball_class="ball powerball ball",
+         draw_times=((1, time(20, 58)), (4, time(20, 58)))),
+    Game("daily-lotto", "Daily Lotto", _url("DAILY_LOTTO_URL", "daily-lotto"),
+         ball_range=36, pick_count=5, ball_class="ball daily-lotto ball",
+         draw_times=tuple((weekday, time(21, 0)) for weekday in range(7))),
+)}
+
+# Comma-separated game keys to serve and refresh; empty serves every game.
+# The default game is always enabled.
+ENABLED_GAMES = [key.strip() for key in os.environ.get("ENABLED_GAMES", "").split(",") if key.strip()] \
+    or list(GAMES)
+if DEFAULT_GAME not in ENABLED_GAMES:
+    ENABLED_GAMES.insert(0, DEFAULT_GAME)
+
+
+def get_game(key: str) -> Game:
+    """Return the enabled game ``key``; raises KeyError for unknown or disabled games."""
+    if key not in ENABLED_GAMES or key not in GAMES:
+        raise KeyError(key)
+    return GAMES[key]
@@ -0,0 +1,187 @@
+import os
+import struct
+import logging
+import threading
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Optional
+
+from app.frequency_model import FrequencyModel
+
+logger = logging.getLogger(__name__)
+
+# Append-only history of scraped frequencies. Set to an empty string to disable.
+HISTORY_PATH = os.path.expanduser(os.environ.get(
+    "HISTORY_PATH", os.path.join('~', 'lottoscope.adaptiveware.dev', 'cache', 'history.bin')))
+# Balls tracked per record when a new history file is created.
+HISTORY_WIDTH = int(os.environ.get("HISTORY_WIDTH", 52))
+
+# File layout: header (magic, format version, width), then fixed-size records
+# of fetched_at (float64) followed by ``width`` uint32 cumulative counts for
+# balls 1..width.
+HISTORY_MAGIC = b"LHST"
+HISTORY_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sBH")
+_TIME = struct.Struct("<d")
+
+
+class FrequencyHistory:
+    """Append-only ball x time matrix of cumulative draw counts.
+
+    The upstream page reports how often each ball has been drawn in total, so
+    the difference between two records is the number of times each ball came
+    up in between. A record is only appended when the counts change, which
+    makes each record roughly one draw; a window of the last N records is
+    therefore "the last N draws" and is answered from two rows, independent of
+    how long the history is.
+
+    Records are kept in flat in-memory arrays and mirrored to a file that is
+    only ever appended to. Other processes pick up new records incrementally
+    from the file's tail.
+    """
+
+    def __init__(self, path: str = None, width: int = HISTORY_WIDTH):
+        self.path = path
+        self.width = width
+        self.times = array("d")
+        self.counts = array("I")
+        self._offset = 0
+        self._lock = threading.Lock()
+        if path:
+            self._load()
+
+    @property
+    def record_size(self) -> int:
+        return _TIME.size + 4 * self.width
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def row(self, index: int) -> array:
+        """Cumulative counts of record ``index`` (negative indexes allowed)."""
+        index = range(len(self.times))[index]
+        return self.counts[index * self.width:(index + 1) * self.width]
+
+    def append(self, snapshot) -> bool:
+        """Record a snapshot; returns False if its counts match the last record."""
+        with self._lock:
+            self._sync()
+            counts = array("I", [0]) * self.width
+            for ball, count in snapshot.frequencies.items():
+                if not 1 <= ball <= self.width:
+                    logger.warning("Ball %s outside history width %s; not recorded.", ball, self.width)
+                    return False
+                counts[ball - 1] = count
+
+            if self.times and self.row(-1) == counts:
+                return False
+            if self.path:
+                try:
+                    self._write(_TIME.pack(snapshot.fetched_at) + counts.tobytes())
+                except OSError as e:
+                    logger.error("Unable to append to frequency history %s: %s", self.path, e)
+                    return False
+                self._offset += self.record_size
+            self.times.append(snapshot.fetched_at)
+            self.counts.extend(counts)
+            return True
+
+    def window(self, draws: int, end: int = -1) -> Optional[Dict[int, int]]:
+        """Per-ball draw counts over the ``draws`` records ending at ``end``.
+
+        Returns None until at least two records exist; shorter histories give
+        the delta since the first record.
+        """
+        with self._lock:
+            self._sync()
+            size = len(self.times)
+            if size < 2 or draws < 1:
+                return None
+            end = range(size)[end]
+            start = max(0, end - draws)
+            if start == end:
+                return None
+            latest, earliest = self.row(end), self.row(start)
+        return {ball: latest[ball - 1] - earliest[ball - 1]
+                for ball in range(1, self.width + 1) if latest[ball - 1]}
+
+    def window_since(self, timestamp: float) -> Optional[Dict[int, int]]:
+        """Per-ball draw counts since the first record at or after ``timestamp``."""
+        with self._lock:
+            self._sync()
+            start = bisect_left(self.times, timestamp)
+            size = len(self.times)
+        if size - start < 2:
+            return None
+        return self.window(size - 1 - start)
+
+    def window_model(self, draws: int) -> Optional[FrequencyModel]:
+        """``window(draws)`` as a FrequencyModel for the selection functions."""
+        frequencies = self.window(draws)
+        return FrequencyModel(frequencies) if frequencies else None
+
+    def trend(self, draws: int) -> Optional[List[dict]]:
+        """Compare each ball's last ``draws`` window with the window before it."""
+        recent = self.window(draws)
+        if recent is None:
+            return None
+        with self._lock:
+            previous_end = max(0, len(self.times) - 1 - draws)
+        previous = self.window(draws, end=previous_end) or {}
+        return [{
+            "ball": ball,
+            "recent": recent[ball],
+            "previous": previous.get(ball, 0),
+            "change": recent[ball] - previous.get(ball, 0),
+        } for ball in sorted(recent)]
+
+    def _load(self) -> None:
+        with self._lock:
+            self._sync()
+
+    def _read_header(self) -> bool:
+        """Validate the file header and position past it; False if unusable."""
+        try:
+            with open(self.path, "rb") as f:
+                header = f.read(_HEADER.size)
+        except OSError:
+            return False
+        if len(header) < _HEADER.size:
+            return False
+        magic, version, width = _HEADER.unpack(header)
+        if magic != HISTORY_MAGIC or version != HISTORY_FORMAT_VERSION:
+            logger.error("Ignoring frequency history %s with unknown format.", self.path)
+            self.path = None
+            return False
+        self.width = width
+        self._offset = _HEADER.size
+        return True
+
+    def _sync(self) -> None:
+        """Read records appended to the file (by any process) since the last sync."""
+        if not self.path:
+            return
+        if self._offset == 0 and not self._read_header():
+            return
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return
+        complete = (size - self._offset) // self.record_size * self.record_size
+        if complete <= 0:
+            return
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read(complete)
+        for start in range(0, len(data), self.record_size):
+            self.times.append(_TIME.unpack_from(data, start)[0])
+            self.counts.frombytes(data[start + _TIME.size:start + self.record_size])
+        self._offset += len(data)
+
+    def _write(self, record: bytes) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "ab") as f:
+            if self._offset == 0:
+                f.write(_HEADER.pack(HISTORY_MAGIC, HISTORY_FORMAT_VERSION, self.width))
+                self._offset = _HEADER.size
+            f.write(record)
@@ -0,0 +1,233 @@
+import os
+import mmap
+import fcntl
+import struct
+import logging
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from math import comb
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# File header: magic, format version, snapshot version (NUL padded), ball
+# count, then issued / collision / reset counters; the bitset follows at
+# _HEADER_SIZE. A file with any other magic is treated as empty.
+ISSUED_MAGIC = b"LSIT"
+ISSUED_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sB32sHQQQ")
+_HEADER_SIZE = 64
+
+
+def ticket_rank(numbers: Iterable[int], balls: int) -> Optional[int]:
+    """Combinatorial rank of a ticket among all ``C(balls, len(numbers))`` tickets.
+
+    Uses the combinatorial number system on the sorted, 0-based numbers, so
+    every distinct ticket maps to a unique integer below ``comb(balls, k)``.
+    Returns None for tickets that repeat a number or fall outside 1..balls.
+    """
+    ordered = sorted(numbers)
+    if not ordered or ordered[0] < 1 or ordered[-1] > balls or len(set(ordered)) != len(ordered):
+        return None
+    return sum(comb(number - 1, position) for position, number in enumerate(ordered, 1))
+
+
+@lru_cache(maxsize=8)
+def _comb_table(balls: int, pick_count: int):
+    import numpy as np
+
+    return np.array([[comb(n, k) for k in range(pick_count + 1)] for n in range(balls)], dtype=np.int64)
+
+
+def ticket_ranks(tickets, balls: int):
+    """Vectorized ``ticket_rank`` for an ``(n, k)`` array: ``(ranks, valid)``.
+
+    Rows that ``ticket_rank`` would reject are flagged False in ``valid``;
+    their rank is meaningless.
+    """
+    import numpy as np
+
+    ordered = np.sort(np.asarray(tickets, dtype=np.int64), axis=1)
+    pick_count = ordered.shape[1]
+    valid = (ordered[:, 0] >= 1) & (ordered[:, -1] <= balls) & np.all(np.diff(ordered, axis=1) > 0, axis=1)
+    table = _comb_table(balls, pick_count)
+    ranks = table[np.clip(ordered - 1, 0, balls - 1), np.arange(1, pick_count + 1)].sum(axis=1)
+    return ranks, valid
+
+
+class IssuedTickets:
+    """Exact bitset of every ticket issued during one draw period.
+
+    Each ticket is stored as one bit at its combinatorial rank, e.g. 1.75 MB
+    for the 13,983,816 six-from-49 tickets, so there are no false positives
+    and memory is fixed no matter how many tickets are issued. The bitset is
+    stamped with the snapshot version and cleared whenever that version (and
+    so the draw period) changes.
+
+    With a ``path`` the bitset lives in a memory-mapped file shared by every
+    worker on the host, updated under an exclusive ``flock``; without one (or
+    if the file cannot be opened) tracking is per process.
+    """
+
+    def __init__(self, pick_count: int, path: Optional[str] = None):
+        self.pick_count = pick_count
+        self.path = path
+        self._buffer = None
+        self._fd = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _open(self) -> None:
+        if self._fd is not None and self._pid == os.getpid():
+            return
+        if self._fd is not None:
+            # Forked worker: flock is shared with the parent's descriptor.
+            os.close(self._fd)
+            self._fd = None
+            self._buffer = None
+        if self.path is None:
+            if self._buffer is None:
+                self._buffer = bytearray(_HEADER_SIZE)
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            self._pid = os.getpid()
+        except OSError as e:
+            logger.error("Unable to open issued-ticket file %s: %s; tracking per process.", self.path, e)
+            self.path = None
+            self._buffer = bytearray(_HEADER_SIZE)
+
+    def _map(self, size: int = None) -> None:
+        """Map the file, resized to ``size`` (zeroing the bitset) if given."""
+        if self._fd is None:
+            if size is not None:
+                self._buffer = bytearray(size)
+            return
+        if size is not None:
+            self._buffer = None
+            os.ftruncate(self._fd, _HEADER_SIZE)
+            os.ftruncate(self._fd, size)
+        file_size = os.fstat(self._fd).st_size
+        if file_size < _HEADER_SIZE:
+            os.ftruncate(self._fd, _HEADER_SIZE)
+            file_size = _HEADER_SIZE
+        if self._buffer is None or len(self._buffer) != file_size:
+            # Another worker resized the file for a new draw period.
+            self._buffer = mmap.mmap(self._fd, file_size)
+
+    @contextmanager
+    def _locked(self):
+        with self._lock:
+            self._open()
+            if self._fd is None:
+                yield
+                return
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                self._map()
+                yield
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _read_header(self) -> tuple:
+        magic, fmt, version, balls, issued, collisions, resets = _HEADER.unpack_from(self._buffer)
+        if magic != ISSUED_MAGIC or fmt != ISSUED_FORMAT_VERSION:
+            return b"", 0, 0, 0, 0
+        return version.rstrip(b"\0"), balls, issued, collisions, resets
+
+    def _write_header(self, version: bytes, balls: int, issued: int, collisions: int, resets: int) -> None:
+        _HEADER.pack_into(self._buffer, 0, ISSUED_MAGIC, ISSUED_FORMAT_VERSION, version, balls,
+                          issued, collisions, resets)
+
+    def _prepare(self, version, balls: int) -> tuple:
+        """Header for ``version``, clearing the bitset if the draw period changed."""
+        stamp = str(version).encode("utf-8")[:32] if version is not None else b""
+        header = self._read_header()
+        current, current_balls, issued, collisions, resets = header
+        if stamp == current and balls <= current_balls:
+            return header
+        if current_balls:
+            resets += 1
+        balls = max(balls, current_balls) if stamp == current else balls
+        self._map(_HEADER_SIZE + (comb(balls, self.pick_count) + 7) // 8)
+        header = (stamp, balls, 0, collisions, resets)
+        self._write_header(*header)
+        return header
+
+    def add(self, numbers, version, balls: int) -> bool:
+        """Record a ticket; False if it was already issued under ``version``.
+
+        Tickets that cannot be ranked (wrong size, duplicates, out of range)
+        are not tracked and always count as new.
+        """
+        if len(numbers) != self.pick_count:
+            return True
+        with self._locked():
+            stamp, balls, issued, collisions, resets = self._prepare(version, balls)
+            rank = ticket_rank(numbers, balls)
+            if rank is None:
+                return True
+            byte, bit = divmod(rank, 8)
+            byte += _HEADER_SIZE
+            if self._buffer[byte] >> bit & 1:
+                self._write_header(stamp, balls, issued, collisions + 1, resets)
+                return False
+            self._buffer[byte] |= 1 << bit
+            self._write_header(stamp, balls, issued + 1, collisions, resets)
+            return True
+
+    def add_many(self, tickets, version, balls: int):
+        """Record an ``(n, pick_count)`` array of tickets in one pass.
+
+        Returns a boolean array that is False for rows already issued under
+        ``version``, including repeats of an earlier row in ``tickets``.
+        """
+        import numpy as np
+
+        tickets = np.asarray(tickets)
+        fresh = np.ones(len(tickets), dtype=bool)
+        if tickets.ndim != 2 or tickets.shape[1] != self.pick_count or not len(tickets):
+            return fresh
+        with self._locked():
+            stamp, balls, issued, collisions, resets = self._prepare(version, balls)
+            ranks, valid = ticket_ranks(tickets, balls)
+            bits = np.frombuffer(self._buffer, dtype=np.uint8, offset=_HEADER_SIZE)
+            byte, bit = ranks >> 3, (ranks & 7).astype(np.uint8)
+            rows = np.flatnonzero(valid)
+            first = np.zeros(len(tickets), dtype=bool)
+            first[rows[np.unique(ranks[rows], return_index=True)[1]]] = True
+            new = valid & first & ((bits[np.where(valid, byte, 0)] >> bit) & 1 == 0)
+            np.bitwise_or.at(bits, byte[new], np.left_shift(1, bit[new]).astype(np.uint8))
+            del bits
+            added = int(new.sum())
+            repeats = int(valid.sum()) - added
+            self._write_header(stamp, balls, issued + added, collisions + repeats, resets)
+            fresh[valid] = new[valid]
+            return fresh
+
+    @property
+    def issued(self) -> int:
+        return self.stats()["issued"]
+
+    @property
+    def collisions(self) -> int:
+        return self.stats()["collisions"]
+
+    def stats(self) -> dict:
+        with self._locked():
+            _, balls, issued, collisions, resets = self._read_header()
+            memory = len(self._buffer) - _HEADER_SIZE
+        space = comb(balls, self.pick_count) if balls else 0
+        return {
+            "issued": issued,
+            "collisions": collisions,
+            "resets": resets,
+            "space": space,
+            "memory_bytes": memory,
+            "fill_ratio": issued / space if space else 0.0,
+            # Exact membership: a collision always means a real duplicate.
+            "false_positive_rate": 0.0,
+            "shared": self._fd is not None,
+        }
@@ -0,0 +1,82 @@
+import os
+import queue
+import random
+import atexit
+import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+LOG_FILE_PATH = os.path.expanduser(os.environ.get(
+    "LOG_FILE_PATH", os.path.join('~', 'lottoscope.adaptiveware.dev', 'logs', 'debug.log')))
+LOGGING_LEVEL = os.environ.get("LOGGING_LEVEL", "INFO")
+# Write log records from a background thread instead of the request thread.
+LOG_ASYNC = os.environ.get("LOG_ASYNC", "1") not in ("0", "false", "False", "")
+# Fraction of per-request INFO messages that are kept.
+LOG_REQUEST_SAMPLE_RATE = float(os.environ.get("LOG_REQUEST_SAMPLE_RATE", 1.0))
+
+# Logger for messages emitted on every request; see SamplingFilter.
+REQUEST_LOGGER_NAME = "app.requests"
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+_listener = None
+_configured = False
+
+
+class SamplingFilter(logging.Filter):
+    """Keep a ``rate`` fraction of records below WARNING; always keep the rest."""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+        self._random = random.Random()
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING or self.rate >= 1:
+            return True
+        return self.rate > 0 and self._random.random() < self.rate
+
+
+class DeferredQueueHandler(QueueHandler):
+    """Enqueue records untouched so %-formatting happens on the writer thread.
+
+    The stock QueueHandler formats each message in the calling thread before
+    enqueueing it; records never leave this process, so that is unnecessary.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+def configure_logging():
+    """Install the file and console handlers (once per process).
+
+    With LOG_ASYNC the root logger only gets a queue handler, and a
+    QueueListener thread does formatting, file writes and rotation.
+    """
+    global _listener, _configured
+    if _configured:
+        return
+    _configured = True
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    os.makedirs(os.path.dirname(LOG_FILE_PATH), exist_ok=True)
+    file_handler = RotatingFileHandler(
+        LOG_FILE_PATH, maxBytes=5 * 1024 * 1024, backupCount=3)
+    stream_handler = logging.StreamHandler()
+    handlers = [file_handler, stream_handler]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    root = logging.getLogger()
+    root.setLevel(LOGGING_LEVEL)
+    if LOG_ASYNC:
+        log_queue = queue.SimpleQueue()
+        root.addHandler(DeferredQueueHandler(log_queue))
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
+    else:
+        for handler in handlers:
+            root.addHandler(handler)
+
+    logging.getLogger(REQUEST_LOGGER_NAME).addFilter(SamplingFilter(LOG_REQUEST_SAMPLE_RATE))
@@ -0,0 +1,108 @@
+import logging
+import threading
+from collections import deque
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TicketPool:
+    """Bounded ring buffer of pre-built tickets filled by a background thread.
+
+    ``source`` returns the current draw snapshot (or None) and ``build`` turns
+    its frequencies into a ticket payload. Tickets are tagged with the
+    snapshot version they were built from; when a caller or the producer sees
+    a new version the buffer is dropped and refilled. ``pop`` never builds or
+    blocks, so an empty pool is reported as an underflow and the caller falls
+    back to building inline.
+    """
+
+    def __init__(self, source: Callable, build: Callable[[object], dict], capacity: int = 256,
+                 low_watermark: Optional[int] = None, poll_interval: float = 1.0):
+        self.capacity = capacity
+        self.low_watermark = low_watermark if low_watermark is not None else capacity // 2
+        self.poll_interval = poll_interval
+        self._source = source
+        self._build = build
+        self._tickets = deque(maxlen=capacity)
+        self._version = None
+        self._cond = threading.Condition()
+        self._thread = None
+        self.hits = 0
+        self.underflows = 0
+        self.invalidations = 0
+        self.produced = 0
+
+    def start(self) -> None:
+        """Start the producer thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._produce, name="ticket-pool")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def pop(self, version: str) -> Optional[dict]:
+        """Return a ticket built from snapshot ``version`` in O(1), or None."""
+        with self._cond:
+            if version != self._version:
+                self._invalidate(version)
+            if not self._tickets:
+                self.underflows += 1
+                self._cond.notify()
+                return None
+            ticket = self._tickets.popleft()
+            self.hits += 1
+            if len(self._tickets) < self.low_watermark:
+                self._cond.notify()
+            return ticket
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "capacity": self.capacity,
+                "fill": len(self._tickets),
+                "hits": self.hits,
+                "underflows": self.underflows,
+                "invalidations": self.invalidations,
+                "produced": self.produced,
+                "version": self._version,
+            }
+
+    def _invalidate(self, version) -> None:
+        if self._version is not None:
+            self.invalidations += 1
+            logger.info("Snapshot changed; discarding pooled tickets.")
+        self._tickets.clear()
+        self._version = version
+        self._cond.notify()
+
+    def _produce(self) -> None:
+        while True:
+            try:
+                filled = self._fill_once()
+            except Exception as e:
+                logger.error("Ticket pool producer error: %s", e)
+                filled = False
+            with self._cond:
+                if not filled or len(self._tickets) >= self.low_watermark:
+                    self._cond.wait(self.poll_interval)
+
+    def _fill_once(self) -> bool:
+        """Top the buffer up from the current snapshot; False if nothing to do."""
+        snapshot = self._source()
+        if snapshot is None:
+            return False
+        with self._cond:
+            if snapshot.version != self._version:
+                self._invalidate(snapshot.version)
+            missing = self.capacity - len(self._tickets)
+        if missing <= 0:
+            return False
+
+        tickets = [self._build(snapshot.frequencies) for _ in range(missing)]
+        with self._cond:
+            # Drop the work if the snapshot moved on while we were building.
+            if snapshot.version == self._version:
+                self._tickets.extend(tickets)
+                self.produced += len(tickets)
+        return True
@@ -1,23 +1,208 @@
-from flask import Blueprint, jsonify
-from app.services import generate_pen_lotto_numbers
-from app.fun_facts import get_random_fun_fact
+import queue
+import threading
+
+from flask import Blueprint, Response, jsonify, request, stream_with_context
+from app.services import (BATCH_MAX_COUNT, BATCH_STREAM_THRESHOLD, HISTORY_MAX_WINDOW,
+                          SEED_MAX_LENGTH, SIMULATION_MAX_TICKETS, generate_pen_lotto_batch,
+                          generate_pen_lotto_numbers, get_draw_snapshot, get_frequency_trends,
+                          get_games_status, get_lotto_jackpot, simulate_pen_strategy,
+                          simulation_slots)
+from app.games import DEFAULT_GAME, get_game
+from app.metrics import render_metrics, timed
+from app.responses import (VersionedLRU, cacheable_response, dumps, encode_body, home_response,
+                           json_response, negotiate_encoding, not_modified_response, strong_etag)
 
 api_bp = Blueprint('api', __name__)
 
+# Rendered ``?seed=`` responses per game, dropped when the game's snapshot changes.
+seeded_responses = {}
+
 
 @api_bp.route('/', methods=['GET'])
 def home():
-    """Base route returning fun facts about the app."""
-    return jsonify({
-        "title": "Lottoscope - Like Horoscope",
-        "description": "A lotto number generator based on pseudo-random algorithms and frequency analysis.",
-        "fun_fact": get_random_fun_fact(),
-        "disclaimer": "Gambling is addictive. This is just a fun project created out of boredom. Values generated here are likely to lose you money!"
-    })
+    """Base route returning fun facts about the app.
+
+    Bodies are pre-encoded (and precompressed) at startup; see app.responses.
+    """
+    return home_response()
+
+
+def _seeded_generate(game, window, seed):
+    """Reproducible ticket for ``seed``, cacheable by clients and proxies.
+
+    The ETag is derived from everything the body depends on, so conditional
+    requests and repeats are answered without running the pipeline.
+    """
+    cache = seeded_responses.setdefault(game, VersionedLRU())
+    encoding = negotiate_encoding()
+    snapshot = get_draw_snapshot(game)
+    if snapshot is not None:
+        etag = strong_etag(game, snapshot.version, window, seed, encoding)
+        if request.if_none_match.contains(etag):
+            return not_modified_response(etag)
+        cached = cache.get(snapshot.version, etag)
+        if cached is not None:
+            return cacheable_response(*cached, etag)
+
+    result = generate_pen_lotto_numbers(window=window, game=game, seed=seed)
+    if "error" in result or result.get("snapshot") is None:
+        return json_response(result)
+    etag = strong_etag(game, result["snapshot"], window, seed, encoding)
+    with timed("jsonify"):
+        body, used_encoding = encode_body(result, encoding)
+    cache.put(result["snapshot"], etag, (body, used_encoding))
+    return cacheable_response(body, used_encoding, etag)
+
+
+def _generate(game, window=None):
+    seed = request.args.get('seed')
+    if seed is not None:
+        if not 1 <= len(seed) <= SEED_MAX_LENGTH:
+            return jsonify({"error": f"seed must be between 1 and {SEED_MAX_LENGTH} characters."}), 400
+        return _seeded_generate(game, window, seed)
+    result = generate_pen_lotto_numbers(window=window, game=game)
+    with timed("jsonify"):
+        return json_response(result)
 
 
 @api_bp.route('/generate', methods=['GET'])
 def generate():
-    """Endpoint to generate lotto numbers."""
-    result = generate_pen_lotto_numbers()
-    return jsonify(result)
+    """Endpoint to generate lotto numbers.
+
+    ``?window=N`` bases the frequency stages on the last N recorded draws.
+    ``?seed=S`` returns the same ticket for S until the snapshot changes.
+    """
+    window = request.args.get('window', type=int)
+    if window is not None and not 1 <= window <= HISTORY_MAX_WINDOW:
+        return jsonify({"error": f"window must be an integer between 1 and {HISTORY_MAX_WINDOW}."}), 400
+    return _generate(DEFAULT_GAME, window)
+
+
+@api_bp.route('/generate/<game>', methods=['GET'])
+def generate_game(game):
+    """Endpoint to generate numbers for one game of the registry (``/games``)."""
+    try:
+        get_game(game)
+    except KeyError:
+        return jsonify({"error": f"Unknown game: {game}."}), 404
+    return _generate(game)
+
+
+@api_bp.route('/games', methods=['GET'])
+def games():
+    """Enabled games with their snapshot staleness and refresh failures."""
+    return json_response({"games": get_games_status()})
+
+
+@api_bp.route('/generate/batch', methods=['GET'])
+def generate_batch():
+    """Endpoint to generate many lotto tickets in one call.
+
+    Large batches (or clients accepting ``application/x-ndjson``) are streamed
+    as one JSON ticket per line. ``?game=`` selects another game; for games
+    with a bonus ball each NDJSON line carries ``bonus`` and the JSON body a
+    ``bonus`` list parallel to ``tickets``.
+    """
+    count = request.args.get('count', default=1, type=int)
+    if count is None or not 1 <= count <= BATCH_MAX_COUNT:
+        return jsonify({"error": f"count must be an integer between 1 and {BATCH_MAX_COUNT}."}), 400
+    game = request.args.get('game', default=DEFAULT_GAME)
+    try:
+        get_game(game)
+    except KeyError:
+        return jsonify({"error": f"Unknown game: {game}."}), 404
+
+    try:
+        batches = generate_pen_lotto_batch(count, game=game)
+    except ValueError as e:
+        return jsonify({"error": str(e)})
+
+    wants_ndjson = request.accept_mimetypes.best == 'application/x-ndjson'
+    if count > BATCH_STREAM_THRESHOLD or wants_ndjson:
+        def lines():
+            for chunk, bonus in batches:
+                if bonus is None:
+                    yield b"".join(b'{"numbers":' + dumps(row) + b'}\n' for row in chunk)
+                else:
+                    yield b"".join(b'{"numbers":' + dumps(row) + b',"bonus":' + dumps(ball) + b'}\n'
+                                   for row, ball in zip(chunk, bonus.tolist()))
+
+        return Response(stream_with_context(lines()), mimetype='application/x-ndjson')
+
+    tickets, bonuses = [], []
+    for chunk, bonus in batches:
+        tickets.extend(chunk.tolist())
+        if bonus is not None:
+            bonuses.extend(bonus.tolist())
+    result = {
+        "jackpot": get_lotto_jackpot(game),
+        "count": count,
+        "tickets": tickets,
+    }
+    if get_game(game).bonus_range:
+        # Bonus ball of each ticket, in the same order as ``tickets``.
+        result["bonus"] = bonuses
+    return json_response(result)
+
+
+@api_bp.route('/trends', methods=['GET'])
+def trends():
+    """Hot, cold, rising and falling numbers over the last ``?window=N`` draws."""
+    window = request.args.get('window', default=10, type=int)
+    if window is None or not 1 <= window <= HISTORY_MAX_WINDOW:
+        return jsonify({"error": f"window must be an integer between 1 and {HISTORY_MAX_WINDOW}."}), 400
+    try:
+        return json_response(get_frequency_trends(window))
+    except ValueError as e:
+        return jsonify({"error": str(e)})
+
+
+@api_bp.route('/simulate', methods=['GET'])
+def simulate():
+    """Stream a Monte Carlo run of the strategy as NDJSON progress lines.
+
+    Every line is a partial result; the last one has ``"done": true``.
+    Disconnecting cancels the remaining work. Only SIMULATION_MAX_CONCURRENT
+    simulations run at once; further requests get a 429.
+    """
+    tickets = request.args.get('tickets', default=100_000, type=int)
+    seed = request.args.get('seed', type=int)
+    if tickets is None or not 1 <= tickets <= SIMULATION_MAX_TICKETS:
+        return jsonify({"error": f"tickets must be an integer between 1 and {SIMULATION_MAX_TICKETS}."}), 400
+    if not simulation_slots.acquire(blocking=False):
+        return jsonify({"error": "Too many simulations are running. Please try again later."}), 429
+
+    updates = queue.Queue()
+    cancel = threading.Event()
+
+    def run():
+        try:
+            updates.put(simulate_pen_strategy(tickets, seed=seed, progress=updates.put, cancel=cancel))
+        except ValueError as e:
+            updates.put({"error": str(e), "done": True})
+        except Exception:
+            updates.put({"error": "An error occurred during the simulation.", "done": True})
+        finally:
+            simulation_slots.release()
+
+    thread = threading.Thread(target=run)
+    thread.daemon = True
+    thread.start()
+
+    def lines():
+        try:
+            while True:
+                update = updates.get()
+                yield dumps(update) + b"\n"
+                if update.get("done"):
+                    return
+        finally:
+            cancel.set()
+
+    return Response(lines(), mimetype='application/x-ndjson')
+
+
+@api_bp.route('/metrics', methods=['GET'])
+def metrics():
+    """Prometheus text exposition of stage timings, cache and upstream counters."""
+    return Response(render_metrics(), mimetype='text/plain; version=0.0.4')
@@ -0,0 +1,84 @@
+import os
+import random
+from datetime import datetime, time, timedelta, timezone
+from typing import Callable, Optional
+
+# South African Lotto draws: Wednesday and Saturday at 20:57 SAST (UTC+2, no DST).
+# Other games pass their own (weekday, time) pairs; see app.games.
+DRAW_TIMEZONE = timezone(timedelta(hours=2))
+DRAW_TIMES = ((2, time(20, 57)), (5, time(20, 57)))
+
+# Poll every DRAW_POLL_INTERVAL seconds for DRAW_WINDOW_HOURS after a draw,
+# and every IDLE_POLL_INTERVAL seconds (at most) the rest of the week.
+DRAW_POLL_INTERVAL = int(os.environ.get("DRAW_POLL_INTERVAL", 600))
+IDLE_POLL_INTERVAL = int(os.environ.get("IDLE_POLL_INTERVAL", 6 * 3600))
+DRAW_WINDOW_HOURS = float(os.environ.get("DRAW_WINDOW_HOURS", 6))
+
+_jitter = random.Random()
+
+
+def draws_around(now: datetime, draw_times=DRAW_TIMES):
+    """Draw datetimes from a week before ``now`` to a week after, in order."""
+    local = now.astimezone(DRAW_TIMEZONE)
+    monday = (local - timedelta(days=local.weekday())).date()
+    draws = []
+    for week in (-1, 0, 1):
+        for weekday, at in draw_times:
+            day = monday + timedelta(days=7 * week + weekday)
+            draws.append(datetime.combine(day, at, tzinfo=DRAW_TIMEZONE))
+    return sorted(draws)
+
+
+def next_refresh_delay(now: datetime = None, jitter: float = 0.1, draw_times=DRAW_TIMES) -> float:
+    """Seconds until the next upstream poll.
+
+    Inside a post-draw window results are polled every DRAW_POLL_INTERVAL;
+    otherwise every IDLE_POLL_INTERVAL, cut short so the first poll lands at
+    the next draw. ``jitter`` spreads workers by up to that fraction.
+    """
+    now = now or datetime.now(DRAW_TIMEZONE)
+    window = timedelta(hours=DRAW_WINDOW_HOURS)
+    draws = draws_around(now, draw_times)
+
+    spread = 1 + _jitter.uniform(-jitter, jitter)
+    if any(draw <= now < draw + window for draw in draws):
+        return max(1.0, DRAW_POLL_INTERVAL * spread)
+    next_draw = next(draw for draw in draws if draw > now)
+    return max(1.0, min(IDLE_POLL_INTERVAL * spread, (next_draw - now).total_seconds()))
+
+
+def refresh_due(fetched_at: Optional[float], now: datetime = None, jitter: float = 0.1,
+                draw_times=DRAW_TIMES) -> bool:
+    """Whether a snapshot fetched at ``fetched_at`` (epoch seconds) should be polled now.
+
+    The same rules as ``next_refresh_delay``: a draw since the fetch, or an
+    age past the current poll interval (less ``jitter``), makes it due.
+    """
+    if fetched_at is None:
+        return True
+    now = now or datetime.now(DRAW_TIMEZONE)
+    fetched = datetime.fromtimestamp(fetched_at, DRAW_TIMEZONE)
+    window = timedelta(hours=DRAW_WINDOW_HOURS)
+    draws = draws_around(now, draw_times)
+    if any(fetched < draw <= now for draw in draws):
+        return True
+    in_window = any(draw <= now < draw + window for draw in draws)
+    interval = DRAW_POLL_INTERVAL if in_window else IDLE_POLL_INTERVAL
+    return (now - fetched).total_seconds() >= interval * (1 - jitter)
+
+
+def draw_schedule_trigger(delay: Callable[[datetime], float] = next_refresh_delay):
+    """APScheduler trigger that fires ``delay(now)`` seconds after each run.
+
+    Built on demand so apscheduler is only imported when the scheduler starts.
+    """
+    from apscheduler.triggers.base import BaseTrigger
+
+    class DrawScheduleTrigger(BaseTrigger):
+        def get_next_fire_time(self, previous_fire_time, now):
+            return now + timedelta(seconds=delay(now))
+
+        def __str__(self):
+            return "draw-schedule"
+
+    return DrawScheduleTrigger()
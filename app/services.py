@@ -1,128 +1,149 @@
 import os
-import re
 import random
-import requests
-from bs4 import BeautifulSoup
+import hashlib
 import logging
 import time
-from functools import lru_cache
 import threading
-from logging.handlers import RotatingFileHandler
+from concurrent.futures import ThreadPoolExecutor, wait
 
 from app.fun_facts import get_random_fun_fact
+from app.frequency_model import FrequencyModel
+from app.games import DEFAULT_GAME, ENABLED_GAMES, GAMES, Game
+from app.history import HISTORY_PATH, FrequencyHistory
+from app.issued import IssuedTickets
+from app.logging_config import REQUEST_LOGGER_NAME
+from app.metrics import Gauge, timed, untimed
+from app.pool import TicketPool
+from app.snapshot import DrawSnapshot, SnapshotCache
+from app.schedule import next_refresh_delay, refresh_due
+from app.shared_cache import SNAPSHOT_CACHE_PATH, SharedSnapshotStore
+from app.upstream import UpstreamClient
 
-home_directory = os.path.expanduser("~")
+logger = logging.getLogger(__name__)
+# Per-request INFO messages; sampled by LOG_REQUEST_SAMPLE_RATE.
+request_logger = logging.getLogger(REQUEST_LOGGER_NAME)
 
-# Logger Configuration with RotatingFileHandler
-LOG_FILE_PATH = os.path.join(
-    home_directory, 'lottoscope.adaptiveware.dev', 'logs', 'debug.log')
+# URL for scraping lotto frequencies; other games' URLs live in app.games.
+LOTTO_URL = GAMES[DEFAULT_GAME].url
 
-log_handler = RotatingFileHandler(
-    LOG_FILE_PATH, maxBytes=5 * 1024 * 1024, backupCount=3)
-log_handler.setLevel(logging.INFO)
-log_handler.setFormatter(logging.Formatter(
-    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+# Batch generation limits; batches above the threshold stream as NDJSON.
+BATCH_MAX_COUNT = int(os.environ.get("BATCH_MAX_COUNT", 10000))
+BATCH_STREAM_THRESHOLD = int(os.environ.get("BATCH_STREAM_THRESHOLD", 500))
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        log_handler,
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger(__name__)
+# Largest draw window accepted by /trends and /generate?window=.
+HISTORY_MAX_WINDOW = int(os.environ.get("HISTORY_MAX_WINDOW", 1000))
+
+# Largest simulation accepted by /simulate (the CLI is not limited), worker
+# processes per HTTP simulation, and how many may run at once; extra requests
+# get a 429.
+SIMULATION_MAX_TICKETS = int(os.environ.get("SIMULATION_MAX_TICKETS", 1_000_000))
+SIMULATION_HTTP_WORKERS = int(os.environ.get("SIMULATION_HTTP_WORKERS", 1))
+SIMULATION_MAX_CONCURRENT = int(os.environ.get("SIMULATION_MAX_CONCURRENT", 1))
+
+# Longest ?seed= accepted for reproducible tickets.
+SEED_MAX_LENGTH = int(os.environ.get("SEED_MAX_LENGTH", 64))
+
+# Size of the pre-generated ticket pool served by /generate; 0 disables it.
+TICKET_POOL_SIZE = int(os.environ.get("TICKET_POOL_SIZE", 0))
+
+# Re-sample tickets already issued since the last snapshot change, up to this
+# many times per request; 0 disables duplicate suppression.
+TICKET_RESAMPLE_ATTEMPTS = int(os.environ.get("TICKET_RESAMPLE_ATTEMPTS", 8))
 
-# URL for scraping lotto frequencies
-LOTTO_URL = 'https://za.national-lottery.com/lotto/hot-numbers'
+# Threads refreshing the games' upstream pages concurrently, and how long a
+# scheduled refresh waits for them before moving on.
+GAME_REFRESH_WORKERS = int(os.environ.get("GAME_REFRESH_WORKERS", 4))
+GAME_REFRESH_TIMEOUT = float(os.environ.get("GAME_REFRESH_TIMEOUT", 30))
+
+
+upstream_client = UpstreamClient(pool_maxsize=max(4, GAME_REFRESH_WORKERS))
+
+# Held by each running /simulate request.
+simulation_slots = threading.BoundedSemaphore(SIMULATION_MAX_CONCURRENT) \
+    if SIMULATION_MAX_CONCURRENT > 0 else threading.Semaphore(0)
 
 
 def fetch_html(url: str) -> str:
     """Helper function to fetch HTML content with error handling and retry logic."""
-    try:
-        logger.info(f"Fetching content from {url}...")
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()  # Raise error for failed requests
-        return response.text
-    except requests.RequestException as e:
-        logger.error(f"Error fetching URL {url}: {e}")
-        return None
-    except Exception as e:
-        logger.error(f"Unexpected error while fetching URL {url}: {e}")
-        return None
+    return upstream_client.fetch(url, conditional=False)
 
 
 def get_top_numbers(draw_frequencies, count, reverse=True):
     """Utility function to get top or bottom numbers from frequencies."""
+    if isinstance(draw_frequencies, FrequencyModel):
+        return draw_frequencies.top(count) if reverse else draw_frequencies.bottom(count)
     return [number for number, _ in sorted(draw_frequencies.items(), key=lambda item: item[1], reverse=reverse)[:count]]
 
 
-@lru_cache(maxsize=1)
-def fetch_draw_frequencies() -> dict:
-    """Scrape lotto number frequencies with caching and error handling."""
-    html_content = fetch_html(LOTTO_URL)
+frequency_history = FrequencyHistory(HISTORY_PATH or None)
 
-    if not html_content:
-        return {}
 
-    try:
-        # Parse the HTML content
-        soup = BeautifulSoup(html_content, 'html.parser')
-
-        # Extract frequencies
-        table_cells = soup.find_all("div", class_="tableCell centred fluid")
-        if not table_cells:
-            raise ValueError("Unable to find table cells for lotto numbers.")
-
-        frequencies = {}
-        for cell in table_cells:
-            try:
-                ball = int(
-                    cell.find("div", class_="ball lotto ball").text.strip())
-                drawn_text = int(cell.find("strong").text.strip())
-                frequencies[ball] = drawn_text
-            except (ValueError, AttributeError):
-                logger.warning("Skipped malformed cell during scraping.")
-
-        logger.info("Successfully fetched draw frequencies.")
-        return frequencies
-    except Exception as e:
-        logger.error(f"Error processing lotto draw frequencies: {e}")
-        return {}
+def game_cache_path(key: str) -> str:
+    """Shared snapshot file for game ``key``; Lotto keeps SNAPSHOT_CACHE_PATH itself."""
+    if not SNAPSHOT_CACHE_PATH or key == DEFAULT_GAME:
+        return SNAPSHOT_CACHE_PATH
+    root, ext = os.path.splitext(SNAPSHOT_CACHE_PATH)
+    return f"{root}-{key}{ext}"
 
 
-def get_lotto_jackpot(url: str = LOTTO_URL) -> str:
-    """Fetch the current jackpot amount."""
-    html_content = fetch_html(url)
+def make_game_cache(game: Game, on_refresh=None) -> SnapshotCache:
+    """Independent snapshot cache (and shared store) for one game."""
+    path = game_cache_path(game.key)
 
-    if not html_content:
-        return None
+    def parsed(snapshot):
+        # Only a page that parsed may be revalidated with a conditional GET.
+        upstream_client.commit_validators(game.url)
+        if on_refresh is not None:
+            on_refresh(snapshot)
 
-    try:
-        soup = BeautifulSoup(html_content, "html.parser")
+    def adopt(shared):
+        # Another worker's snapshot stands in for a fetch until the game's
+        # schedule would poll it again (a draw, or its current poll interval).
+        return shared.age() < cache.ttl and not refresh_due(shared.fetched_at, draw_times=game.draw_times)
 
-        # The jackpot is within a span with a specific class.
-        jackpot_element = soup.find("span", class_="jackpotTxt")
+    cache = SnapshotCache(
+        lambda: upstream_client.fetch(game.url, conditional=cache.peek() is not None),
+        store=SharedSnapshotStore(path) if path else None,
+        on_refresh=parsed, rules=game.rules, adopt=adopt)
+    return cache
 
-        if jackpot_element:
-            jackpot_text = jackpot_element.text.strip()
-            # Clean up the text (remove extra whitespace, etc.)
-            jackpot_text = re.sub(r"\s+", " ", jackpot_text)
-            return jackpot_text
-        else:
-            logger.warning(
-                "Jackpot element not found on the page. The website structure may have changed.")
-            return None
 
-    except Exception as e:
-        logger.error(f"Unexpected error while fetching jackpot: {e}")
+# Frequency history is only recorded for the default game.
+snapshot_cache = make_game_cache(GAMES[DEFAULT_GAME], on_refresh=frequency_history.append)
+
+game_caches = {DEFAULT_GAME: snapshot_cache}
+game_caches.update({key: make_game_cache(GAMES[key]) for key in ENABLED_GAMES if key not in game_caches})
+
+
+def get_draw_snapshot(game: str = DEFAULT_GAME) -> DrawSnapshot:
+    """Return the game's shared draw snapshot, fetching upstream only when needed."""
+    return game_caches[game].get()
+
+
+def fetch_draw_frequencies(game: str = DEFAULT_GAME) -> FrequencyModel:
+    """Return the game's number frequencies from its cached draw snapshot.
+
+    The result is the snapshot's prebuilt FrequencyModel, so selection
+    functions rank numbers without sorting per request.
+    """
+    snapshot = get_draw_snapshot(game)
+    if snapshot is None:
+        return {}
+    return snapshot.frequencies
+
+
+def get_lotto_jackpot(game: str = DEFAULT_GAME) -> str:
+    """Return the game's current jackpot amount from its cached draw snapshot."""
+    snapshot = get_draw_snapshot(game)
+    if snapshot is None:
         return None
+    return snapshot.jackpot
 
 
-def lucky_echo_bias(draw_frequencies, top_count=14, return_count=7):
+def lucky_echo_bias(draw_frequencies, top_count=14, return_count=7, rng=random):
     """Apply Lucky Echo Bias to select frequent lotto numbers."""
     top_numbers = get_top_numbers(draw_frequencies, top_count)
-    random.shuffle(top_numbers)
+    rng.shuffle(top_numbers)
     return top_numbers[:return_count]
 
 
@@ -131,12 +152,12 @@ def inverse_fortuna_boost(draw_frequencies, bottom_count=5):
     return get_top_numbers(draw_frequencies, bottom_count, reverse=False)
 
 
-def chaos_jitter(range_=49, count=5):
+def chaos_jitter(range_=49, count=5, rng=random):
     """Generate random chaotic numbers within a specified range."""
-    return [random.randint(1, range_) for _ in range(count)]
+    return [rng.randint(1, range_) for _ in range(count)]
 
 
-def enforce_universal_balance(numbers, lucky_numbers):
+def enforce_universal_balance(numbers, lucky_numbers, pick_count=6, rng=random):
     """Enforce universal balance among selected numbers."""
     if not isinstance(numbers, list) or not isinstance(lucky_numbers, list):
         return []
@@ -145,71 +166,282 @@ def enforce_universal_balance(numbers, lucky_numbers):
     lucky_numbers = list(set(lucky_numbers))
 
     all_available_numbers = numbers + lucky_numbers
-    random.shuffle(all_available_numbers)
-    random.shuffle(lucky_numbers)
+    rng.shuffle(all_available_numbers)
+    rng.shuffle(lucky_numbers)
 
     result = lucky_numbers[:min(2, len(lucky_numbers))]
 
     multiples_of_7 = [num for num in numbers if num %
                       7 == 0 and num not in result]
     if multiples_of_7:
-        result.extend(multiples_of_7[:1])
+        # Uniform among the candidates, like the batch engine in app.batch.
+        result.append(rng.choice(multiples_of_7))
 
     remaining_numbers = list(set(all_available_numbers) - set(result))
-    random.shuffle(remaining_numbers)
-    result.extend(remaining_numbers[:6 - len(result)])
+    rng.shuffle(remaining_numbers)
+    result.extend(remaining_numbers[:pick_count - len(result)])
+
+    return result[:pick_count]
+
+
+def build_pen_ticket(draw_frequencies, game: Game = GAMES[DEFAULT_GAME], rng=random,
+                     timer=timed) -> dict:
+    """Run the PEN pipeline once and return the ticket numbers and reasons.
+
+    Every random choice is drawn from ``rng``, so a seeded ``random.Random``
+    reproduces the same ticket. Stages are timed with ``timer``; background
+    builders pass ``untimed`` so request stage metrics only see requests.
+    """
+    with timer("lucky_echo_bias"):
+        lucky_numbers = lucky_echo_bias(draw_frequencies, game.top_count, game.lucky_count, rng)
+    with timer("inverse_fortuna_boost"):
+        underdog_numbers = inverse_fortuna_boost(draw_frequencies, game.bottom_count)
+    with timer("chaos_jitter"):
+        chaotic_numbers = chaos_jitter(game.ball_range, game.chaos_count, rng)
+    with timer("enforce_universal_balance"):
+        final_numbers = enforce_universal_balance(
+            chaotic_numbers + underdog_numbers, lucky_numbers, game.pick_count, rng)
+
+    reasons = [
+        f"Selected most frequently drawn numbers: {', '.join(map(str, lucky_numbers))}",
+        f"Boosted least frequently drawn numbers: {', '.join(map(str, underdog_numbers))}",
+        f"Generated random chaotic numbers: {', '.join(map(str, chaotic_numbers))}",
+        f"Enforced universal balance: {', '.join(map(str, final_numbers))}",
+    ]
+    ticket = {"numbers": final_numbers, "reasons": reasons}
+    if game.bonus_range:
+        ticket["bonus"] = chaos_jitter(game.bonus_range, 1, rng)[0]
+        reasons.append(f"Drew the bonus ball by chaos jitter: {ticket['bonus']}")
+    return ticket
 
-    return result[:6]
 
+def _build_pooled_ticket(draw_frequencies) -> dict:
+    return build_pen_ticket(draw_frequencies, timer=untimed)
 
-def generate_pen_lotto_numbers():
-    """Generate the final lotto numbers based on various biases and randomness."""
-    logger.info("Generating lotto numbers...")
+
+# The producer peeks at the snapshot rather than calling get(), so its polls
+# are not counted as cache hits; requests adopt and refresh the snapshot and
+# pop() hands the producer any new version.
+ticket_pool = TicketPool(snapshot_cache.peek, _build_pooled_ticket,
+                         capacity=TICKET_POOL_SIZE) if TICKET_POOL_SIZE > 0 else None
+
+if ticket_pool is not None:
+    Gauge("lottoscope_ticket_pool_fill", "Tickets currently pooled.",
+          lambda: ticket_pool.stats()["fill"])
+    Gauge("lottoscope_ticket_pool_underflows", "Pool pops that found no ticket.",
+          lambda: ticket_pool.underflows)
+    Gauge("lottoscope_ticket_pool_invalidations", "Pool flushes caused by snapshot changes.",
+          lambda: ticket_pool.invalidations)
+
+
+def seeded_rng(seed: str, version: str, game: str = DEFAULT_GAME, window: int = None) -> random.Random:
+    """Private RNG for ``seed`` under one snapshot version, stable across processes."""
+    key = f"{game}\0{version}\0{window}\0{seed}".encode("utf-8")
+    return random.Random(int.from_bytes(hashlib.sha256(key).digest(), "big"))
+
+
+def issued_tickets_path(key: str) -> str:
+    """Shared issued-ticket bitset for game ``key``, next to SNAPSHOT_CACHE_PATH."""
+    if not SNAPSHOT_CACHE_PATH:
+        return None
+    return os.path.join(os.path.dirname(SNAPSHOT_CACHE_PATH), f"issued-{key}.bin")
+
+
+issued_tickets = {key: IssuedTickets(GAMES[key].pick_count, issued_tickets_path(key)) for key in game_caches}
+
+Gauge("lottoscope_issued_tickets", "Distinct tickets issued since the last snapshot change.",
+      lambda: sum(tracker.issued for tracker in issued_tickets.values()))
+Gauge("lottoscope_issued_ticket_collisions", "Issued-ticket collisions that forced a re-sample.",
+      lambda: sum(tracker.collisions for tracker in issued_tickets.values()))
+Gauge("lottoscope_issued_tickets_bytes", "Memory mapped by the issued-ticket bitsets.",
+      lambda: sum(tracker.stats()["memory_bytes"] for tracker in issued_tickets.values()))
+
+
+def _issue_tracking(draw_frequencies, game: str):
+    """``(tracker, version, balls)`` for duplicate suppression, or None when disabled."""
+    tracker = issued_tickets.get(game)
+    if tracker is None or TICKET_RESAMPLE_ATTEMPTS <= 0:
+        return None
+    snapshot = game_caches[game].peek()
+    version = snapshot.version if snapshot is not None else None
+    return tracker, version, max(GAMES[game].ball_range, max(draw_frequencies))
+
+
+def issue_unique_ticket(ticket: dict, draw_frequencies, game: str) -> dict:
+    """Return ``ticket``, or a re-sampled one if it was already issued this draw period."""
+    tracking = _issue_tracking(draw_frequencies, game)
+    if tracking is None:
+        return ticket
+    tracker, version, balls = tracking
+    for _ in range(TICKET_RESAMPLE_ATTEMPTS):
+        if tracker.add(ticket["numbers"], version, balls):
+            return ticket
+        with timed("resample"):
+            ticket = build_pen_ticket(draw_frequencies, GAMES[game])
+    logger.warning("Issuing a duplicate %s ticket after %d re-samples.", game, TICKET_RESAMPLE_ATTEMPTS)
+    return ticket
+
+
+def generate_pen_lotto_numbers(window: int = None, game: str = DEFAULT_GAME, seed: str = None):
+    """Generate the final lotto numbers based on various biases and randomness.
+
+    With ``window`` the frequency-based stages only consider the last
+    ``window`` recorded draws instead of all-time frequencies (default game
+    only). ``game`` is a key of ``app.games.GAMES``. With ``seed`` every
+    random choice comes from ``seeded_rng``, so the same seed gives the same
+    ticket until the snapshot changes; the result then carries the seed and
+    the snapshot version.
+    """
+    request_logger.info("Generating %s numbers...", game)
     try:
-        draw_frequencies = fetch_draw_frequencies()
+        seeded_snapshot = None
+        with timed("snapshot"):
+            if seed is None:
+                draw_frequencies = fetch_draw_frequencies(game)
+            else:
+                # Read the snapshot once so frequencies, jackpot and the
+                # version stamped on the result can never disagree.
+                seeded_snapshot = get_draw_snapshot(game)
+                draw_frequencies = seeded_snapshot.frequencies if seeded_snapshot is not None else {}
         if not draw_frequencies:
             raise ValueError(
                 "Unable to fetch draw frequencies. Please try again later.")
-
-        lucky_numbers = lucky_echo_bias(draw_frequencies)
-        underdog_numbers = inverse_fortuna_boost(draw_frequencies)
-        chaotic_numbers = chaos_jitter()
-        final_numbers = enforce_universal_balance(
-            chaotic_numbers + underdog_numbers, lucky_numbers)
-
-        reasons = [
-            f"Selected most frequently drawn numbers: {', '.join(map(str, lucky_numbers))}",
-            f"Boosted least frequently drawn numbers: {', '.join(map(str, underdog_numbers))}",
-            f"Generated random chaotic numbers: {', '.join(map(str, chaotic_numbers))}",
-            f"Enforced universal balance: {', '.join(map(str, final_numbers))}",
-        ]
-
-        logger.info("Lotto numbers generated successfully.")
-        return {
-            "jackpot": get_lotto_jackpot(url=LOTTO_URL),
-            "numbers": final_numbers,
-            "reasons": reasons,
-            "fun_fact": get_random_fun_fact(),
+        rng = random
+        if seeded_snapshot is not None:
+            rng = seeded_rng(seed, seeded_snapshot.version, game, window)
+        if window is not None and game != DEFAULT_GAME:
+            raise ValueError("Draw history is only recorded for the default game.")
+        if window is not None:
+            draw_frequencies = frequency_history.window_model(window)
+            if draw_frequencies is None:
+                raise ValueError(
+                    "Not enough draw history for a windowed selection yet. Please try again later.")
+
+        ticket = None
+        if ticket_pool is not None and window is None and seed is None and game == DEFAULT_GAME:
+            snapshot = get_draw_snapshot()
+            if snapshot is not None:
+                with timed("pool_pop"):
+                    ticket = ticket_pool.pop(snapshot.version)
+        if ticket is None:
+            ticket = build_pen_ticket(draw_frequencies, GAMES[game], rng)
+        if seed is None:
+            ticket = issue_unique_ticket(ticket, draw_frequencies, game)
+
+        with timed("fun_fact"):
+            fun_fact = get_random_fun_fact(rng)
+
+        request_logger.info("Lotto numbers generated successfully.")
+        result = {
+            "jackpot": seeded_snapshot.jackpot if seeded_snapshot is not None else get_lotto_jackpot(game),
+            "numbers": ticket["numbers"],
+            "reasons": ticket["reasons"],
+            "fun_fact": fun_fact,
         }
+        if "bonus" in ticket:
+            result["bonus"] = ticket["bonus"]
+        if game != DEFAULT_GAME:
+            result["game"] = game
+        if seeded_snapshot is not None:
+            result["seed"] = seed
+            result["snapshot"] = seeded_snapshot.version
+        return result
 
-    except requests.RequestException as e:
-        logger.error(f"Error fetching lotto frequencies: {e}")
-        return {"error": "Unable to fetch lotto frequencies. Please check your network connection and try again."}
     except ValueError as e:
-        logger.error(f"Error in data processing: {e}")
+        logger.error("Error in data processing: %s", e)
         return {"error": str(e)}
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         return {"error": "An error occurred during lotto number generation. Please try again later."}
 
 
+def get_frequency_trends(window: int) -> dict:
+    """Hot/cold balls over the last ``window`` draws and their change vs the window before."""
+    trend = frequency_history.trend(window)
+    if trend is None:
+        raise ValueError("Not enough draw history for trends yet. Please try again later.")
+    by_recent = sorted(trend, key=lambda item: item["recent"], reverse=True)
+    by_change = sorted(trend, key=lambda item: item["change"], reverse=True)
+    return {
+        "window": window,
+        "draws_recorded": len(frequency_history),
+        "hot": [item["ball"] for item in by_recent[:6]],
+        "cold": [item["ball"] for item in by_recent[-6:][::-1]],
+        "rising": [item["ball"] for item in by_change[:6]],
+        "falling": [item["ball"] for item in by_change[-6:][::-1]],
+        "balls": trend,
+    }
+
+
+def simulate_pen_strategy(tickets: int, seed: int = None, workers: int = SIMULATION_HTTP_WORKERS,
+                          progress=None, cancel=None) -> dict:
+    """Monte Carlo run of the PEN pipeline against the current frequencies."""
+    from app.simulator import simulate
+
+    draw_frequencies = fetch_draw_frequencies()
+    if not draw_frequencies:
+        raise ValueError(
+            "Unable to fetch draw frequencies. Please try again later.")
+    return simulate(draw_frequencies, tickets, workers=workers, seed=seed,
+                    progress=progress, cancel=cancel)
+
+
+def generate_pen_lotto_batch(count: int, game: str = DEFAULT_GAME):
+    """Generate ``count`` tickets with the vectorized engine.
+
+    Returns an iterator of ``(tickets, bonus)`` chunks, ``(n, pick_count)``
+    ticket arrays plus the bonus balls of games that have one, so large
+    batches can be streamed chunk by chunk. Rows are recorded in the game's
+    issued-ticket bitset like /generate tickets, and repeats are re-drawn.
+    """
+    from app.batch import iter_ticket_batches
+
+    request_logger.info("Generating batch of %d %s tickets...", count, game)
+    draw_frequencies = fetch_draw_frequencies(game)
+    if not draw_frequencies:
+        raise ValueError(
+            "Unable to fetch draw frequencies. Please try again later.")
+    spec = GAMES[game]
+    accept = None
+    tracking = _issue_tracking(draw_frequencies, game)
+    if tracking is not None:
+        tracker, version, balls = tracking
+
+        def accept(tickets):
+            return tracker.add_many(tickets, version, balls)
+
+    return iter_ticket_batches(draw_frequencies, count, top_count=spec.top_count,
+                               lucky_count=spec.lucky_count, bottom_count=spec.bottom_count,
+                               range_=spec.ball_range, chaos_count=spec.chaos_count,
+                               pick_count=spec.pick_count, bonus_range=spec.bonus_range,
+                               accept=accept, redraws=TICKET_RESAMPLE_ATTEMPTS)
+
+
+def next_game_refresh_delay(now=None) -> float:
+    """Seconds until the earliest next poll across enabled games' draw schedules."""
+    return min(next_refresh_delay(now, draw_times=GAMES[key].draw_times) for key in game_caches)
+
+
+def due_games(now=None) -> list:
+    """Games whose snapshot should be polled now under their own draw schedule.
+
+    Each cache first adopts the shared snapshot, so a worker that has served
+    no requests does not count a game as due that another worker just polled.
+    """
+    due = []
+    for key, cache in game_caches.items():
+        snapshot = cache.warm()
+        if refresh_due(snapshot.fetched_at if snapshot is not None else None, now,
+                       draw_times=GAMES[key].draw_times):
+            due.append(key)
+    return due
+
+
 def refresh_frequency_cache():
-    """Refresh the frequency cache periodically (every 24 hours)."""
+    """Refresh the frequency cache periodically, more often around draws."""
     while True:
-        logger.info("Refreshing frequency cache...")
-        fetch_draw_frequencies.cache_clear()
-        fetch_draw_frequencies()
-        time.sleep(86400)  # Sleep for 24 hours
+        refresh_frequency_cache_task()
+        time.sleep(next_game_refresh_delay())
 
 
 def start_cache_refresh_task():
@@ -219,7 +451,64 @@ def start_cache_refresh_task():
     thread.start()
 
 
+_refresh_executor = None
+_refresh_futures = {}
+_refresh_lock = threading.Lock()
+
+
+def refresh_game_caches(timeout: float = GAME_REFRESH_TIMEOUT, games=None) -> dict:
+    """Refresh ``games`` (default: all) concurrently on a bounded thread pool.
+
+    Waits up to ``timeout`` seconds and returns ``{game: True/False/None}``
+    for refreshed, not refreshed and still running. A game whose previous refresh
+    is still running is not resubmitted, so one slow upstream page never
+    holds up the other games or piles up work in the pool.
+    """
+    global _refresh_executor
+    with _refresh_lock:
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(
+                max_workers=GAME_REFRESH_WORKERS, thread_name_prefix="game-refresh")
+        keys = list(game_caches) if games is None else games
+        for key in keys:
+            future = _refresh_futures.get(key)
+            if future is None or future.done():
+                _refresh_futures[key] = _refresh_executor.submit(game_caches[key].refresh)
+        futures = {key: _refresh_futures[key] for key in keys}
+
+    wait(futures.values(), timeout=timeout)
+    results = {}
+    for key, future in futures.items():
+        if not future.done():
+            logger.warning("Refresh of %s still running after %.0fs.", key, timeout)
+            results[key] = None
+        elif future.exception() is not None:
+            logger.error("Refresh of %s failed: %s", key, future.exception())
+            results[key] = False
+        else:
+            results[key] = future.result() is not None
+    return results
+
+
+def get_games_status() -> list:
+    """Per-game snapshot staleness and refresh failures, for /games."""
+    status = []
+    for key, cache in game_caches.items():
+        game = GAMES[key]
+        status.append({
+            "game": key,
+            "name": game.name,
+            "ball_range": game.ball_range,
+            "pick_count": game.pick_count,
+            "bonus_range": game.bonus_range,
+            **cache.status(),
+            "issued_tickets": issued_tickets[key].stats(),
+        })
+    return status
+
+
 def refresh_frequency_cache_task():
-    logger.info("Refreshing frequency cache...")
-    fetch_draw_frequencies.cache_clear()
-    fetch_draw_frequencies()
+    games = due_games()
+    logger.info("Refreshing frequency cache for %s...", ", ".join(games) or "no games")
+    if games:
+        refresh_game_caches(games=games)
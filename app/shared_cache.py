@@ -0,0 +1,142 @@
+import os
+import fcntl
+import struct
+import logging
+import tempfile
+import threading
+from array import array
+from contextlib import contextmanager
+from typing import Optional
+
+from app.snapshot import DrawSnapshot, make_snapshot
+
+logger = logging.getLogger(__name__)
+
+# File shared by every worker on the host, and kept across restarts so new
+# workers start warm. Set to an empty string to disable.
+SNAPSHOT_CACHE_PATH = os.path.expanduser(os.environ.get(
+    "SNAPSHOT_CACHE_PATH", os.path.join('~', 'lottoscope.adaptiveware.dev', 'cache', 'snapshot.bin')))
+
+# Binary layout: magic, format version, fetched_at, ball count, jackpot length
+# (0xFFFF for none), then the UTF-8 jackpot, uint16 balls and uint32 counts.
+SNAPSHOT_MAGIC = b"LSNP"
+SNAPSHOT_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sBdHH")
+_NO_JACKPOT = 0xFFFF
+
+
+def serialize_snapshot(snapshot: DrawSnapshot) -> bytes:
+    balls = array("H", snapshot.frequencies.keys())
+    counts = array("I", snapshot.frequencies.values())
+    jackpot = snapshot.jackpot.encode("utf-8") if snapshot.jackpot is not None else b""
+    header = _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, snapshot.fetched_at, len(balls),
+                          len(jackpot) if snapshot.jackpot is not None else _NO_JACKPOT)
+    return header + jackpot + balls.tobytes() + counts.tobytes()
+
+
+def deserialize_snapshot(data: bytes) -> DrawSnapshot:
+    magic, version, fetched_at, size, jackpot_length = _HEADER.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError("Unrecognised snapshot file format.")
+
+    offset = _HEADER.size
+    jackpot = None
+    if jackpot_length != _NO_JACKPOT:
+        jackpot = data[offset:offset + jackpot_length].decode("utf-8")
+        offset += jackpot_length
+
+    balls = array("H")
+    counts = array("I")
+    balls.frombytes(data[offset:offset + 2 * size])
+    offset += 2 * size
+    counts.frombytes(data[offset:offset + 4 * size])
+    if len(balls) != size or len(counts) != size:
+        raise ValueError("Truncated snapshot file.")
+    return make_snapshot(dict(zip(balls, counts)), jackpot, fetched_at=fetched_at)
+
+
+class SharedSnapshotStore:
+    """Host-wide snapshot file shared by all worker processes.
+
+    The file outlives the processes, so a freshly started worker loads the
+    last good snapshot instead of scraping upstream.
+
+    Writers replace the file atomically, so readers always see either the
+    previous or the next complete snapshot. Readers only re-read the file
+    when its inode or mtime changes. Refreshes are single-flight across
+    processes through an exclusive ``flock`` on a sibling lock file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock_path = path + ".lock"
+        self._stamp = None
+        self._snapshot: Optional[DrawSnapshot] = None
+        self._read_lock = threading.Lock()
+
+    def load(self) -> Optional[DrawSnapshot]:
+        """Return the stored snapshot, re-reading the file only if it changed."""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if stamp == self._stamp:
+            return self._snapshot
+
+        with self._read_lock:
+            if stamp == self._stamp:
+                return self._snapshot
+            try:
+                with open(self.path, "rb") as f:
+                    snapshot = deserialize_snapshot(f.read())
+            except (OSError, ValueError, struct.error) as e:
+                logger.warning("Ignoring unreadable shared snapshot %s: %s", self.path, e)
+                return self._snapshot
+            self._snapshot = snapshot
+            self._stamp = stamp
+            return snapshot
+
+    def save(self, snapshot: DrawSnapshot) -> None:
+        """Atomically publish a snapshot to every worker."""
+        directory = os.path.dirname(self.path) or "."
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".snapshot-")
+        except OSError as e:
+            logger.error("Unable to write shared snapshot %s: %s", self.path, e)
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(serialize_snapshot(snapshot))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.error("Unable to write shared snapshot %s: %s", self.path, e)
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    @contextmanager
+    def leader(self, blocking: bool = False):
+        """Yield True if this process won the right to refresh upstream."""
+        try:
+            os.makedirs(os.path.dirname(self.lock_path) or ".", exist_ok=True)
+            fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError as e:
+            logger.error("Unable to open snapshot lock %s: %s", self.lock_path, e)
+            yield True
+            return
+        try:
+            flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+            try:
+                fcntl.flock(fd, flags)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
@@ -0,0 +1,172 @@
+"""Monte Carlo evaluation of the PEN strategy against frequency-weighted draws.
+
+Usage: python -m app.simulator [--tickets 10000000] [--workers N] [--seed 42] [--task-size 250000]
+                               [--frequencies tests/fixtures/hot_numbers.html]
+
+Each ticket from the vectorized engine (``app.batch``) is matched against its
+own random draw of six balls, sampled without replacement with probability
+proportional to the scraped frequencies. Work is split into fixed-size tasks
+run on a process pool; each task gets its own child of one SeedSequence, so
+a given seed reproduces the same result regardless of worker count.
+"""
+import os
+import sys
+import json
+import time
+import signal
+import argparse
+import threading
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Optional
+
+import numpy as np
+
+from app.batch import BATCH_CHUNK_SIZE, generate_ticket_batch
+from app.frequency_model import FrequencyModel
+
+SIMULATION_TASK_SIZE = int(os.environ.get("SIMULATION_TASK_SIZE", 250000))
+SIMULATION_WORKERS = int(os.environ.get("SIMULATION_WORKERS", os.cpu_count() or 1))
+
+
+def weighted_draws(frequencies: FrequencyModel, count: int, rng: np.random.Generator,
+                   balls: int = 6) -> np.ndarray:
+    """``count`` draws of ``balls`` distinct balls weighted by frequency.
+
+    Uses exponential races: each ball gets an Exp(1) / weight arrival time and
+    the ``balls`` earliest arrivals are a weighted sample without replacement
+    (equivalent to the Gumbel-top-k trick, but cheaper to generate).
+    """
+    numbers = np.fromiter(frequencies.keys(), dtype=np.int64)
+    weights = np.maximum(np.fromiter(frequencies.values(), dtype=np.float32), 1e-12)
+    arrivals = rng.standard_exponential((count, numbers.size), dtype=np.float32) / weights
+    return numbers[np.argpartition(arrivals, balls - 1, axis=1)[:, :balls]]
+
+
+def match_counts(tickets: np.ndarray, draws: np.ndarray) -> np.ndarray:
+    """Histogram of how many balls each ticket shares with its draw (0..6)."""
+    width = int(max(tickets.max(), draws.max())) + 1
+    drawn = np.zeros((len(draws), width), dtype=bool)
+    rows = np.arange(len(draws))[:, None]
+    drawn[rows, draws] = True
+    matches = drawn[rows, tickets].sum(axis=1)
+    return np.bincount(matches, minlength=tickets.shape[1] + 1)
+
+
+def _simulate_task(frequencies: dict, count: int, seed: np.random.SeedSequence) -> list:
+    """Worker entry point: simulate ``count`` tickets with its own RNG stream."""
+    model = FrequencyModel(frequencies)
+    rng = np.random.default_rng(seed)
+    histogram = np.zeros(7, dtype=np.int64)
+    while count > 0:
+        size = min(count, BATCH_CHUNK_SIZE)
+        tickets = generate_ticket_batch(model, size, rng=rng)
+        histogram += match_counts(tickets, weighted_draws(model, size, rng))
+        count -= size
+    return histogram.tolist()
+
+
+def simulate(draw_frequencies, tickets: int, workers: int = SIMULATION_WORKERS, seed: int = None,
+             task_size: int = SIMULATION_TASK_SIZE, progress: Callable[[dict], None] = None,
+             cancel: Optional[threading.Event] = None) -> dict:
+    """Simulate ``tickets`` tickets and return the match-count distribution.
+
+    ``progress`` is called with a partial result after every finished task.
+    Setting ``cancel`` stops scheduling new tasks; the partial result is
+    returned with ``cancelled`` set.
+    """
+    frequencies = dict(draw_frequencies)
+    if len(frequencies) < 6:
+        raise ValueError("Not enough draw frequencies to simulate six-ball tickets.")
+
+    sizes = [task_size] * (tickets // task_size)
+    if tickets % task_size:
+        sizes.append(tickets % task_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    histogram = np.zeros(7, dtype=np.int64)
+    started = time.perf_counter()
+
+    def report(final=False):
+        elapsed = time.perf_counter() - started
+        simulated = int(histogram.sum())
+        return {
+            "tickets": tickets,
+            "simulated": simulated,
+            "matches": {str(k): int(v) for k, v in enumerate(histogram)},
+            "match_rates": {str(k): (int(v) / simulated if simulated else 0.0) for k, v in enumerate(histogram)},
+            "elapsed_seconds": elapsed,
+            "tickets_per_sec": simulated / elapsed if elapsed else 0.0,
+            "cancelled": bool(cancel is not None and cancel.is_set()),
+            "done": final,
+        }
+
+    def collect(result):
+        histogram[:] += np.asarray(result, dtype=np.int64)
+        if progress is not None:
+            progress(report())
+
+    tasks = list(zip(sizes, seeds))
+    if workers <= 1:
+        for size, task_seed in tasks:
+            if cancel is not None and cancel.is_set():
+                break
+            collect(_simulate_task(frequencies, size, task_seed))
+        return report(final=True)
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        pending = set()
+        queued = iter(tasks)
+        # Keep at most two tasks per worker in flight so cancellation is quick.
+        for size, task_seed in queued:
+            pending.add(executor.submit(_simulate_task, frequencies, size, task_seed))
+            if len(pending) >= 2 * workers:
+                break
+        while pending:
+            finished, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+            for future in finished:
+                collect(future.result())
+            if cancel is not None and cancel.is_set():
+                for future in pending:
+                    future.cancel()
+                break
+            for size, task_seed in queued:
+                pending.add(executor.submit(_simulate_task, frequencies, size, task_seed))
+                if len(pending) >= 2 * workers:
+                    break
+    return report(final=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tickets', type=int, default=10_000_000)
+    parser.add_argument('--workers', type=int, default=SIMULATION_WORKERS)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--task-size', type=int, default=SIMULATION_TASK_SIZE)
+    parser.add_argument('--frequencies', help='hot-numbers HTML file to use instead of the live snapshot')
+    args = parser.parse_args(argv)
+
+    if args.frequencies:
+        from app.snapshot import parse_snapshot
+        with open(args.frequencies, encoding='utf-8') as f:
+            draw_frequencies = parse_snapshot(f.read()).frequencies
+    else:
+        from app.services import fetch_draw_frequencies
+        draw_frequencies = fetch_draw_frequencies()
+    if not draw_frequencies:
+        print("Unable to fetch draw frequencies.", file=sys.stderr)
+        return 1
+
+    # Ctrl-C stops scheduling work and prints the partial result.
+    cancel = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: cancel.set())
+    progress = lambda partial: print(json.dumps(partial), file=sys.stderr)  # noqa: E731
+    result = simulate(draw_frequencies, args.tickets, workers=args.workers, seed=args.seed,
+                      task_size=args.task_size, progress=progress, cancel=cancel)
+    print(json.dumps(result, indent=2))
+    return 130 if result["cancelled"] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,241 @@
+import os
+import time
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass, field, replace
+from typing import Callable, Optional
+
+from app.extract import DEFAULT_RULES, ExtractionRules, extract_draw_data
+from app.frequency_model import FrequencyModel
+from app.metrics import SNAPSHOT_CACHE_REQUESTS, timed
+
+logger = logging.getLogger(__name__)
+
+# Seconds a snapshot is considered fresh.
+SNAPSHOT_TTL = int(os.environ.get("SNAPSHOT_TTL", 6 * 3600))
+# Seconds past the TTL during which a stale snapshot is still served while a
+# background refresh runs.
+SNAPSHOT_STALE_WHILE_REVALIDATE = int(
+    os.environ.get("SNAPSHOT_STALE_WHILE_REVALIDATE", 7 * 24 * 3600))
+
+# Returned by a fetch callable when upstream answered 304 Not Modified.
+NOT_MODIFIED = object()
+
+
+@dataclass(frozen=True)
+class DrawSnapshot:
+    """Immutable result of a single scrape of the hot-numbers page."""
+    frequencies: FrequencyModel
+    jackpot: Optional[str]
+    fetched_at: float = field(default_factory=time.time)
+    version: str = ""
+
+    def age(self, now: float = None) -> float:
+        return (now if now is not None else time.time()) - self.fetched_at
+
+
+def make_snapshot(frequencies: dict, jackpot: Optional[str], fetched_at: float = None) -> DrawSnapshot:
+    """Freeze parsed values into a snapshot with a content-derived version."""
+    digest = hashlib.sha1(
+        repr((sorted(frequencies.items()), jackpot)).encode("utf-8")).hexdigest()[:16]
+    return DrawSnapshot(
+        frequencies=FrequencyModel(frequencies),
+        jackpot=jackpot,
+        fetched_at=fetched_at if fetched_at is not None else time.time(),
+        version=digest,
+    )
+
+
+def parse_snapshot(html_content: str, rules: ExtractionRules = DEFAULT_RULES) -> DrawSnapshot:
+    """Extract frequencies and jackpot from the hot-numbers page in one parse."""
+    frequencies, jackpot = extract_draw_data(html_content, rules=rules)
+    if jackpot is None:
+        logger.warning(
+            "Jackpot element not found on the page. The website structure may have changed.")
+    return make_snapshot(frequencies, jackpot)
+
+
+class SnapshotCache:
+    """Serve the latest snapshot with a TTL and stale-while-revalidate.
+
+    Fresh snapshots are returned directly. Stale snapshots inside the
+    revalidation window are returned immediately while a single background
+    thread refreshes them. Only a cold (or expired) cache makes the caller
+    wait on upstream, and concurrent cold callers share one fetch.
+
+    With a ``store`` (see ``app.shared_cache``) the snapshot is shared by all
+    workers on the host and only the process holding the store's leader lock
+    fetches upstream; the others keep serving what they have.
+
+    A shared snapshot younger than ``min_refresh_interval`` seconds is
+    adopted instead of refetched; ``adopt`` replaces that rule with a
+    predicate on the shared snapshot (e.g. the game's draw schedule).
+
+    ``on_refresh`` is called with every newly parsed snapshot, and ``rules``
+    selects the page elements to extract (see ``app.extract``).
+    """
+
+    def __init__(self, fetch: Callable[[], Optional[str]], ttl: int = SNAPSHOT_TTL,
+                 stale_while_revalidate: int = SNAPSHOT_STALE_WHILE_REVALIDATE,
+                 store=None, min_refresh_interval: int = 60,
+                 on_refresh: Callable[[DrawSnapshot], None] = None,
+                 rules: ExtractionRules = DEFAULT_RULES,
+                 adopt: Callable[[DrawSnapshot], bool] = None):
+        self._fetch = fetch
+        self._adopt = adopt
+        self.on_refresh = on_refresh
+        self.rules = rules
+        self.last_success_at: Optional[float] = None
+        self.last_failure_at: Optional[float] = None
+        self.consecutive_failures = 0
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.store = store
+        # A shared snapshot younger than this is adopted instead of refetched.
+        self.min_refresh_interval = min_refresh_interval
+        self._snapshot: Optional[DrawSnapshot] = None
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+        self._refreshing = False
+
+    def warm(self) -> Optional[DrawSnapshot]:
+        """Load the persisted snapshot, if any, without contacting upstream."""
+        return self._adopt_shared()
+
+    def peek(self) -> Optional[DrawSnapshot]:
+        """Return the current snapshot without triggering any refresh."""
+        return self._snapshot
+
+    def get(self) -> Optional[DrawSnapshot]:
+        """Return a usable snapshot, refreshing according to its age."""
+        snapshot = self._adopt_shared()
+        if snapshot is not None:
+            age = snapshot.age()
+            if age < self.ttl:
+                SNAPSHOT_CACHE_REQUESTS.inc(result="hit")
+                return snapshot
+            if age < self.ttl + self.stale_while_revalidate:
+                SNAPSHOT_CACHE_REQUESTS.inc(result="stale")
+                self._refresh_in_background()
+                return snapshot
+
+        SNAPSHOT_CACHE_REQUESTS.inc(result="miss")
+        with self._fetch_lock:
+            # Another thread may have finished the fetch while we waited.
+            current = self._adopt_shared()
+            if current is not None and current is not snapshot:
+                return current
+            return self.refresh(wait=True) or current
+
+    def refresh(self, wait: bool = False) -> Optional[DrawSnapshot]:
+        """Fetch and parse upstream now; keep the old snapshot on failure.
+
+        With a shared store, a process that does not win the leader lock
+        returns None without fetching unless ``wait`` is set, in which case it
+        waits for the leader and adopts its result.
+        """
+        if self.store is None:
+            return self._fetch_and_parse()
+
+        with self.store.leader(blocking=wait) as is_leader:
+            if not is_leader:
+                return None
+            shared = self._adopt_shared()
+            if shared is not None and self._adoptable(shared):
+                return shared
+            snapshot = self._fetch_and_parse()
+            if snapshot is not None:
+                self.store.save(snapshot)
+            return snapshot
+
+    def _adoptable(self, shared: DrawSnapshot) -> bool:
+        if self._adopt is not None:
+            return self._adopt(shared)
+        return shared.age() < self.min_refresh_interval
+
+    def _adopt_shared(self) -> Optional[DrawSnapshot]:
+        """Switch to the shared snapshot if another worker published a newer one."""
+        current = self._snapshot
+        if self.store is None:
+            return current
+        shared = self.store.load()
+        if shared is not None and (current is None or shared.fetched_at > current.fetched_at):
+            self._snapshot = shared
+            return shared
+        return current
+
+    def status(self) -> dict:
+        """Staleness and failure tracking for this cache."""
+        snapshot = self._snapshot
+        age = snapshot.age() if snapshot is not None else None
+        return {
+            "version": snapshot.version if snapshot is not None else None,
+            "age_seconds": age,
+            "stale": age is None or age >= self.ttl,
+            "last_success_at": self.last_success_at,
+            "last_failure_at": self.last_failure_at,
+            "consecutive_failures": self.consecutive_failures,
+        }
+
+    def _record_failure(self) -> None:
+        self.last_failure_at = time.time()
+        self.consecutive_failures += 1
+
+    def _record_success(self) -> None:
+        self.last_success_at = time.time()
+        self.consecutive_failures = 0
+
+    def _fetch_and_parse(self) -> Optional[DrawSnapshot]:
+        html_content = self._fetch()
+        if html_content is NOT_MODIFIED:
+            # Upstream is unchanged: restart the TTL without parsing.
+            if self._snapshot is None:
+                return None
+            snapshot = replace(self._snapshot, fetched_at=time.time())
+            self._snapshot = snapshot
+            self._record_success()
+            return snapshot
+        if not html_content:
+            self._record_failure()
+            return None
+        try:
+            with timed("parse"):
+                snapshot = parse_snapshot(html_content, self.rules)
+        except Exception as e:
+            logger.error("Error processing lotto draw snapshot: %s", e)
+            self._record_failure()
+            return None
+        self._snapshot = snapshot
+        self._record_success()
+        logger.info("Successfully refreshed draw snapshot.")
+        if self.on_refresh is not None:
+            try:
+                self.on_refresh(snapshot)
+            except Exception as e:
+                logger.error("Error in snapshot refresh callback: %s", e)
+        return snapshot
+
+    def set(self, snapshot: DrawSnapshot) -> None:
+        self._snapshot = snapshot
+
+    def clear(self) -> None:
+        self._snapshot = None
+
+    def _refresh_in_background(self) -> None:
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def run():
+            try:
+                with self._fetch_lock:
+                    self.refresh()
+            finally:
+                with self._lock:
+                    self._refreshing = False
+
+        thread = threading.Thread(target=run)
+        thread.daemon = True
+        thread.start()
@@ -0,0 +1,110 @@
+import time
+import random
+import logging
+import threading
+
+from app.metrics import UPSTREAM_BYTES, UPSTREAM_FETCHES, UPSTREAM_SECONDS
+from app.snapshot import NOT_MODIFIED
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class UpstreamClient:
+    """Pooled HTTP client for upstream pages with conditional GETs.
+
+    One ``requests.Session`` keeps connections alive between refreshes. The
+    ETag / Last-Modified of each URL's last 200 response are replayed as
+    If-None-Match / If-Modified-Since, and a 304 is reported as
+    ``NOT_MODIFIED`` so callers can skip parsing. Validators from a 200 are
+    held back until the caller reports a successful parse with
+    ``commit_validators``, so a page that failed to parse is never answered
+    with a 304 that would vouch for the previous snapshot. Connection errors and
+    retryable statuses are retried with full-jitter exponential backoff.
+
+    ``requests`` is only imported when the first fetch happens, so processes
+    that start from a persisted snapshot never pay for it on boot.
+    """
+
+    def __init__(self, timeout: float = 10, retries: int = 2, backoff_base: float = 0.5,
+                 backoff_max: float = 8.0, pool_maxsize: int = 4):
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.pool_maxsize = pool_maxsize
+        self._session = None
+        self._validators = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._jitter = random.Random()
+
+    @property
+    def session(self):
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=self.pool_maxsize, pool_maxsize=self.pool_maxsize)
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    self._session = session
+        return self._session
+
+    def commit_validators(self, url: str) -> None:
+        """Replay the validators of ``url``'s last 200 now that its page parsed."""
+        with self._lock:
+            validators = self._pending.pop(url, None)
+            if validators is not None:
+                self._validators[url] = validators
+
+    def fetch(self, url: str, conditional: bool = True):
+        """Return the page text, ``NOT_MODIFIED`` on a 304, or None on failure."""
+        import requests
+
+        headers = {}
+        if conditional:
+            etag, last_modified = self._validators.get(url, (None, None))
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        for attempt in range(self.retries + 1):
+            start = time.perf_counter()
+            try:
+                logger.info("Fetching content from %s...", url)
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+                if response.status_code == 304:
+                    UPSTREAM_FETCHES.inc(result="not_modified")
+                    logger.info("Upstream %s not modified.", url)
+                    return NOT_MODIFIED
+                if response.status_code in RETRY_STATUSES and attempt < self.retries:
+                    raise requests.HTTPError(f"{response.status_code} from upstream", response=response)
+                response.raise_for_status()
+                UPSTREAM_FETCHES.inc(result="ok")
+                UPSTREAM_BYTES.inc(len(response.content))
+                with self._lock:
+                    self._pending[url] = (response.headers.get("ETag"),
+                                          response.headers.get("Last-Modified"))
+                return response.text
+            except requests.RequestException as e:
+                UPSTREAM_FETCHES.inc(result="error")
+                retryable = e.response is None or e.response.status_code in RETRY_STATUSES
+                if not retryable or attempt == self.retries:
+                    logger.error("Error fetching URL %s: %s", url, e)
+                    return None
+                delay = self._jitter.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+                logger.warning("Error fetching URL %s: %s; retrying in %.2fs", url, e, delay)
+                time.sleep(delay)
+            except Exception as e:
+                UPSTREAM_FETCHES.inc(result="error")
+                logger.error("Unexpected error while fetching URL %s: %s", url, e)
+                return None
+            finally:
+                UPSTREAM_SECONDS.observe(time.perf_counter() - start)
+        return None
@@ -0,0 +1,62 @@
+"""Compare hot-numbers extraction backends on the recorded fixture pages.
+
+Usage: python -m benchmarks.bench_extract [--repeat N] [--json] [--output FILE]
+
+Every backend must produce the same (frequencies, jackpot) as BeautifulSoup;
+the script exits non-zero if any of them disagrees.
+"""
+import os
+import sys
+import json
+import glob
+import logging
+import argparse
+import timeit
+
+from app.extract import EXTRACTORS
+from benchmarks.common import FIXTURE_DIR, write_results
+
+
+def bench_page(path, repeat):
+    with open(path, encoding='utf-8') as f:
+        html_content = f.read()
+
+    reference = EXTRACTORS['soup'](html_content)
+    results = {}
+    for name, extractor in EXTRACTORS.items():
+        seconds = min(timeit.repeat(lambda: extractor(html_content), number=1, repeat=repeat))
+        results[name] = {
+            "seconds": seconds,
+            "identical": extractor(html_content) == reference,
+        }
+    return {"page": os.path.basename(path), "bytes": len(html_content), "backends": results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--json', action='store_true', help='print machine-readable results')
+    parser.add_argument('--output', help='write machine-readable results to this file')
+    args = parser.parse_args(argv)
+
+    # Malformed fixture cells are expected; keep the output readable.
+    logging.disable(logging.WARNING)
+    pages = [bench_page(path, args.repeat) for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, '*.html')))]
+
+    document = write_results("extract", pages, args.output)
+    if args.json:
+        print(json.dumps(document, indent=2))
+    else:
+        for page in pages:
+            soup_seconds = page["backends"]["soup"]["seconds"]
+            print(f"{page['page']} ({page['bytes']} bytes)")
+            for name, result in page["backends"].items():
+                print(f"  {name:<6} {result['seconds'] * 1000:8.2f} ms  "
+                      f"x{soup_seconds / result['seconds']:.1f}  identical={result['identical']}")
+
+    ok = all(result["identical"] for page in pages for result in page["backends"].values())
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""Micro-benchmarks for each PEN selection stage.
+
+Usage: python -m benchmarks.bench_selection [--number N] [--repeat R] [--output FILE]
+
+Frequencies come from the recorded fixture page, so results are comparable
+between commits. Times are the best of ``--repeat`` runs, per call.
+"""
+import os
+import sys
+import json
+import logging
+import argparse
+import timeit
+
+import numpy as np
+
+from app import services
+from app.batch import generate_ticket_batch
+from app.snapshot import parse_snapshot
+from benchmarks.common import FIXTURE_DIR, write_results
+
+
+def load_frequencies():
+    with open(os.path.join(FIXTURE_DIR, 'hot_numbers_full.html'), encoding='utf-8') as f:
+        return parse_snapshot(f.read()).frequencies
+
+
+def cases(model):
+    plain = dict(model)
+    lucky = services.lucky_echo_bias(model)
+    pool = services.chaos_jitter() + services.inverse_fortuna_boost(model)
+    rng = np.random.default_rng(0)
+    return {
+        "get_top_numbers[dict]": lambda: services.get_top_numbers(plain, 14),
+        "get_top_numbers[model]": lambda: services.get_top_numbers(model, 14),
+        "lucky_echo_bias": lambda: services.lucky_echo_bias(model),
+        "inverse_fortuna_boost": lambda: services.inverse_fortuna_boost(model),
+        "chaos_jitter": lambda: services.chaos_jitter(),
+        "enforce_universal_balance": lambda: services.enforce_universal_balance(pool, lucky),
+        "build_pen_ticket": lambda: services.build_pen_ticket(model),
+        "generate_ticket_batch[1000]": lambda: generate_ticket_batch(model, 1000, rng=rng),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=2000, help='calls per timing run')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='write machine-readable results to this file')
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.WARNING)
+    model = load_frequencies()
+    results = {}
+    for name, fn in cases(model).items():
+        number = max(1, args.number // 100) if 'batch' in name else args.number
+        best = min(timeit.repeat(fn, number=number, repeat=args.repeat)) / number
+        results[name] = {"us_per_call": best * 1e6, "calls_per_sec": 1.0 / best}
+
+    print(json.dumps(write_results("selection", results, args.output), indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
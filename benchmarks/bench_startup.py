@@ -0,0 +1,84 @@
+"""Measure time from process start to the first successful /generate.
+
+Usage: python -m benchmarks.bench_startup [--runs 5] [--upstream-latency 0.2] [--output FILE]
+
+Each run starts a fresh interpreter that imports ``run`` and calls /generate
+through the Flask test client, against the local upstream stand-in. "cold"
+runs start with no persisted snapshot; "warm" runs reuse the snapshot file
+written by the previous run, like a newly autoscaled worker would.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+
+from benchmarks.common import REPO_ROOT, latency_summary, write_results
+from benchmarks.upstream import serve_upstream
+
+CHILD = r'''
+import json, sys, time
+start = time.perf_counter()
+import run
+imported = time.perf_counter()
+response = run.app.test_client().get('/generate')
+done = time.perf_counter()
+payload = response.get_json() or {}
+print(json.dumps({
+    "ok": response.status_code == 200 and len(payload.get("numbers", [])) == 6,
+    "import_seconds": imported - start,
+    "first_generate_seconds": done - imported,
+    "total_seconds": done - start,
+}))
+'''
+
+
+def run_once(env):
+    spawned = time.perf_counter()
+    output = subprocess.check_output([sys.executable, '-c', CHILD], cwd=REPO_ROOT, env=env,
+                                     stderr=subprocess.DEVNULL, text=True)
+    result = json.loads(output.strip().splitlines()[-1])
+    result["wall_seconds"] = time.perf_counter() - spawned
+    return result
+
+
+def summarize(runs):
+    return {
+        "ok": all(run["ok"] for run in runs),
+        **{key: latency_summary([run[key] for run in runs])
+           for key in ("import_seconds", "first_generate_seconds", "total_seconds", "wall_seconds")},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--upstream-latency', type=float, default=0.2)
+    parser.add_argument('--output', help='write machine-readable results to this file')
+    args = parser.parse_args(argv)
+
+    results = {}
+    with serve_upstream(latency=args.upstream_latency) as (url, _), tempfile.TemporaryDirectory() as tmpdir:
+        snapshot_path = os.path.join(tmpdir, 'snapshot.bin')
+        history_path = os.path.join(tmpdir, 'history.bin')
+        env = dict(os.environ, LOTTO_URL=url, ENABLED_GAMES='lotto', SNAPSHOT_CACHE_PATH=snapshot_path,
+                   HISTORY_PATH=history_path, LOG_FILE_PATH=os.path.join(tmpdir, 'debug.log'))
+
+        cold = []
+        for _ in range(args.runs):
+            for path in (snapshot_path, snapshot_path + '.lock', history_path):
+                if os.path.exists(path):
+                    os.unlink(path)
+            cold.append(run_once(env))
+        warm = [run_once(env) for _ in range(args.runs)]
+        results = {"cold": summarize(cold), "warm": summarize(warm)}
+
+    document = write_results("startup", results, args.output)
+    print(json.dumps(document, indent=2))
+    return 0 if results["cold"]["ok"] and results["warm"]["ok"] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
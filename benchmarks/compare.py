@@ -0,0 +1,64 @@
+"""Compare two benchmark result files and flag regressions.
+
+Usage: python -m benchmarks.compare BASELINE.json CANDIDATE.json [--threshold 10]
+
+Walks both result trees and compares every numeric leaf they share. Keys
+ending in ``_ms``, ``_us_per_call`` or ``seconds`` are lower-is-better;
+``rps`` and ``calls_per_sec`` are higher-is-better. Exits non-zero if any
+metric got worse by more than ``--threshold`` percent.
+"""
+import sys
+import json
+import argparse
+
+LOWER_IS_BETTER = ('_ms', 'us_per_call', 'seconds')
+HIGHER_IS_BETTER = ('rps', 'calls_per_sec')
+
+
+def flatten(tree, prefix=''):
+    if isinstance(tree, dict):
+        for key, value in tree.items():
+            yield from flatten(value, f"{prefix}.{key}" if prefix else str(key))
+    elif isinstance(tree, list):
+        for index, value in enumerate(tree):
+            yield from flatten(value, f"{prefix}[{index}]")
+    elif isinstance(tree, (int, float)) and not isinstance(tree, bool):
+        yield prefix, tree
+
+
+def direction(key):
+    leaf = key.rsplit('.', 1)[-1]
+    if leaf.endswith(LOWER_IS_BETTER):
+        return -1
+    if leaf.endswith(HIGHER_IS_BETTER):
+        return 1
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('baseline')
+    parser.add_argument('candidate')
+    parser.add_argument('--threshold', type=float, default=10.0, help='allowed regression in percent')
+    args = parser.parse_args(argv)
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = dict(flatten(json.load(f)["results"]))
+    with open(args.candidate, encoding='utf-8') as f:
+        candidate = dict(flatten(json.load(f)["results"]))
+
+    regressions = 0
+    for key in sorted(baseline.keys() & candidate.keys()):
+        sign = direction(key)
+        old, new = baseline[key], candidate[key]
+        if not sign or not old:
+            continue
+        change = (new - old) / old * 100
+        worse = -change * sign > args.threshold
+        regressions += worse
+        print(f"{'REGRESSION' if worse else 'ok':<10} {key}: {old:.4g} -> {new:.4g} ({change:+.1f}%)")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
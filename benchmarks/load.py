@@ -0,0 +1,184 @@
+"""Load-test the app against the local upstream stand-in.
+
+Usage: python -m benchmarks.load [--server gunicorn|werkzeug] [--workers 4] [--threads 1]
+                                 [--concurrency 16] [--duration 10] [--endpoint / --endpoint /generate]
+                                 [--upstream-latency 0.05] [--upstream-error-rate 0] [--output FILE]
+
+The app runs in a subprocess (gunicorn with the given workers/threads, or the
+threaded werkzeug server when gunicorn is unavailable) with ``LOTTO_URL``
+pointed at ``benchmarks.upstream``. Client threads hit the endpoints
+round-robin over keep-alive connections; requests/sec and p50/p95/p99 are
+reported per endpoint.
+"""
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import tempfile
+import threading
+import subprocess
+import http.client
+from collections import defaultdict
+
+from benchmarks.common import REPO_ROOT, latency_summary, write_results
+from benchmarks.upstream import DEFAULT_PAGE, serve_upstream
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_app(server, port, workers, threads, env):
+    if server == 'gunicorn':
+        command = [sys.executable, '-m', 'gunicorn', '-w', str(workers), '--threads', str(threads),
+                   '-b', f'127.0.0.1:{port}', '--log-level', 'warning', 'wsgi:app']
+    else:
+        command = [sys.executable, '-c',
+                   'import sys; from werkzeug.serving import run_simple; from run import app; '
+                   'run_simple("127.0.0.1", int(sys.argv[1]), app, threaded=True)', str(port)]
+    return subprocess.Popen(command, cwd=REPO_ROOT, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def wait_until_ready(port, timeout=30.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=2)
+            connection.request('GET', '/')
+            connection.getresponse().read()
+            connection.close()
+            return True
+        except OSError:
+            time.sleep(0.1)
+    return False
+
+
+def drive(port, endpoints, concurrency, duration):
+    """Hit ``endpoints`` from ``concurrency`` threads for ``duration`` seconds."""
+    samples = defaultdict(list)
+    errors = defaultdict(int)
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def client(offset):
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        local = defaultdict(list)
+        local_errors = defaultdict(int)
+        i = offset
+        while time.perf_counter() < deadline:
+            endpoint = endpoints[i % len(endpoints)]
+            i += 1
+            start = time.perf_counter()
+            try:
+                connection.request('GET', endpoint)
+                response = connection.getresponse()
+                response.read()
+                ok = response.status == 200
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+                ok = False
+            local[endpoint].append(time.perf_counter() - start)
+            if not ok:
+                local_errors[endpoint] += 1
+        connection.close()
+        with lock:
+            for endpoint, values in local.items():
+                samples[endpoint].extend(values)
+            for endpoint, count in local_errors.items():
+                errors[endpoint] += count
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    results = {}
+    for endpoint in endpoints:
+        summary = latency_summary(samples[endpoint])
+        summary["errors"] = errors[endpoint]
+        summary["rps"] = summary["count"] / elapsed if elapsed else 0.0
+        results[endpoint] = summary
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--server', choices=['gunicorn', 'werkzeug'], default=None)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--threads', type=int, default=1)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--warmup', type=int, default=5, help='requests per endpoint before measuring')
+    parser.add_argument('--endpoint', action='append', dest='endpoints')
+    parser.add_argument('--page', default=DEFAULT_PAGE)
+    parser.add_argument('--upstream-latency', type=float, default=0.05)
+    parser.add_argument('--upstream-error-rate', type=float, default=0.0)
+    parser.add_argument('--upstream-slow-rate', type=float, default=0.0)
+    parser.add_argument('--output', help='write machine-readable results to this file')
+    args = parser.parse_args(argv)
+
+    endpoints = args.endpoints or ['/', '/generate']
+    server = args.server
+    if server is None:
+        try:
+            import gunicorn  # noqa: F401
+            server = 'gunicorn'
+        except ImportError:
+            server = 'werkzeug'
+
+    with serve_upstream(page=args.page, latency=args.upstream_latency,
+                        error_rate=args.upstream_error_rate,
+                        slow_rate=args.upstream_slow_rate) as (url, upstream), \
+            tempfile.TemporaryDirectory() as tmpdir:
+        env = dict(os.environ, LOTTO_URL=url, ENABLED_GAMES='lotto',
+                   SNAPSHOT_CACHE_PATH=os.path.join(tmpdir, 'snapshot.bin'),
+                   HISTORY_PATH=os.path.join(tmpdir, 'history.bin'),
+                   LOG_FILE_PATH=os.path.join(tmpdir, 'debug.log'))
+        port = free_port()
+        process = start_app(server, port, args.workers, args.threads, env)
+        try:
+            if not wait_until_ready(port):
+                print("App did not become ready.", file=sys.stderr)
+                return 1
+            for endpoint in endpoints:
+                connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+                for _ in range(args.warmup):
+                    connection.request('GET', endpoint)
+                    connection.getresponse().read()
+                connection.close()
+
+            results = drive(port, endpoints, args.concurrency, args.duration)
+        finally:
+            process.terminate()
+            process.wait(timeout=10)
+
+        document = write_results("load", {
+            "server": server,
+            "workers": args.workers,
+            "threads": args.threads,
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "upstream": {
+                "latency": args.upstream_latency,
+                "error_rate": args.upstream_error_rate,
+                "slow_rate": args.upstream_slow_rate,
+                "requests": upstream.config.requests,
+            },
+            "endpoints": results,
+        }, args.output)
+
+    print(json.dumps(document, indent=2))
+    return 0 if all(r["errors"] == 0 for r in results.values()) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""Local stand-in for the hot-numbers upstream that replays fixture HTML.
+
+Usage: python -m benchmarks.upstream [--port 8099] [--latency 0.05] [--error-rate 0.1]
+                                     [--slow-rate 0.1] [--slow-seconds 2] [--page FILE]
+                                     [--etag '"v1"']
+
+Latency is added to every response. A fraction of requests (``--error-rate``)
+answer 503, and another fraction (``--slow-rate``) trickle the body out over
+``--slow-seconds`` to mimic a struggling upstream. With ``--etag`` the page
+carries that ETag and matching conditional requests get a 304.
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks.common import FIXTURE_DIR
+
+DEFAULT_PAGE = os.path.join(FIXTURE_DIR, 'hot_numbers_full.html')
+
+
+class UpstreamConfig:
+    def __init__(self, page=DEFAULT_PAGE, latency=0.0, error_rate=0.0, slow_rate=0.0, slow_seconds=2.0,
+                 etag=None):
+        with open(page, 'rb') as f:
+            self.body = f.read()
+        self.latency = latency
+        self.error_rate = error_rate
+        self.slow_rate = slow_rate
+        self.slow_seconds = slow_seconds
+        self.etag = etag
+        self.requests = 0
+        self.lock = threading.Lock()
+
+
+class UpstreamHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        config = self.server.config
+        with config.lock:
+            config.requests += 1
+        if config.latency:
+            time.sleep(config.latency)
+
+        if random.random() < config.error_rate:
+            body = b'upstream unavailable'
+            self.send_response(503)
+            self.send_header('Content-Type', 'text/plain')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        if config.etag and self.headers.get('If-None-Match') == config.etag:
+            self.send_response(304)
+            self.send_header('ETag', config.etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        body = config.body
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        if config.etag:
+            self.send_header('ETag', config.etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+
+        if random.random() < config.slow_rate:
+            pieces = 20
+            step = len(body) // pieces + 1
+            for start in range(0, len(body), step):
+                self.wfile.write(body[start:start + step])
+                self.wfile.flush()
+                time.sleep(config.slow_seconds / pieces)
+        else:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def serve_upstream(host='127.0.0.1', port=0, **kwargs):
+    """Run the stand-in upstream in a background thread; yields its URL."""
+    server = ThreadingHTTPServer((host, port), UpstreamHandler)
+    server.daemon_threads = True
+    server.config = UpstreamConfig(**kwargs)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    try:
+        yield f"http://{host}:{server.server_address[1]}/lotto/hot-numbers", server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8099)
+    parser.add_argument('--page', default=DEFAULT_PAGE)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--slow-rate', type=float, default=0.0)
+    parser.add_argument('--slow-seconds', type=float, default=2.0)
+    parser.add_argument('--etag', default=None)
+    args = parser.parse_args(argv)
+
+    with serve_upstream(args.host, args.port, page=args.page, latency=args.latency,
+                        error_rate=args.error_rate, slow_rate=args.slow_rate,
+                        slow_seconds=args.slow_seconds, etag=args.etag) as (url, _):
+        print(f"Serving {args.page} at {url}")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
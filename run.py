@@ -1,34 +1,61 @@
+import atexit
+import threading
+
 from flask import Flask
-from apscheduler.schedulers.background import BackgroundScheduler
-from app.services import refresh_frequency_cache_task
+from app.logging_config import configure_logging
+from app.services import game_caches, next_game_refresh_delay, refresh_frequency_cache_task, ticket_pool
 from app.routes import api_bp  # Import the blueprint
 
 
+def start_scheduler():
+    """Start the refresh scheduler; apscheduler is imported only here.
+
+    Fire at the earliest next poll across the games' draw schedules and
+    refresh only the games that are due, polling often after each game's
+    draws and rarely otherwise. Workers share the snapshot, so only the one
+    holding the refresh lock hits upstream.
+    """
+    from apscheduler.schedulers.background import BackgroundScheduler
+    from app.schedule import draw_schedule_trigger
+
+    scheduler = BackgroundScheduler()
+    scheduler.add_job(
+        refresh_frequency_cache_task,
+        draw_schedule_trigger(next_game_refresh_delay),
+        max_instances=1,
+        coalesce=True,
+    )
+    scheduler.start()
+    atexit.register(lambda: scheduler.shutdown(wait=False))
+
+
 def create_app():
+    configure_logging()
     app = Flask(__name__)
 
     # Register the blueprint
     # Register API routes at the root "/"
     app.register_blueprint(api_bp, url_prefix="/")
 
-    # Scheduler setup
-    scheduler = BackgroundScheduler()
-    scheduler.add_job(
-        refresh_frequency_cache_task,
-        'interval',
-        hours=24,  # Run every 24 hours
-        next_run_time=None  # Start immediately
-    )
+    # Serve the last persisted snapshot straight away instead of scraping on
+    # the first request.
+    for cache in game_caches.values():
+        cache.warm()
+
+    background_started = threading.Event()
+    background_lock = threading.Lock()
 
     @app.before_request
-    def start_scheduler():
-        if not scheduler.running:
-            scheduler.start()
-
-    @app.teardown_appcontext
-    def shutdown_scheduler(exception=None):
-        if scheduler.running:
-            scheduler.shutdown()
+    def start_background_tasks():
+        if not background_started.is_set():
+            with background_lock:
+                if not background_started.is_set():
+                    background_started.set()
+                    thread = threading.Thread(target=start_scheduler)
+                    thread.daemon = True
+                    thread.start()
+        if ticket_pool is not None:
+            ticket_pool.start()
 
     return app
 
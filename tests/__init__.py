@@ -0,0 +1,16 @@
+import os
+import atexit
+import shutil
+import tempfile
+
+# Keep the suite away from the persistent snapshot, history and log files in
+# the user's home and from the live upstream pages. This runs before any test
+# module imports ``app.services``, which reads these at import time.
+_STATE_DIR = tempfile.mkdtemp(prefix="lottoscope-tests-")
+atexit.register(shutil.rmtree, _STATE_DIR, ignore_errors=True)
+
+os.environ["SNAPSHOT_CACHE_PATH"] = os.path.join(_STATE_DIR, "snapshot.bin")
+os.environ["HISTORY_PATH"] = os.path.join(_STATE_DIR, "history.bin")
+os.environ["LOG_FILE_PATH"] = os.path.join(_STATE_DIR, "debug.log")
+for _name in ("LOTTO_URL", "LOTTO_PLUS_URL", "POWERBALL_URL", "DAILY_LOTTO_URL"):
+    os.environ[_name] = "http://127.0.0.1:9/hot-numbers"
@@ -0,0 +1,58 @@
+import json
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from app import create_app
+from app.batch import generate_ticket_batch
+from app.frequency_model import FrequencyModel
+from app.services import build_pen_ticket
+
+FREQUENCIES = {ball: 100 + (ball * 37) % 61 for ball in range(1, 50)}
+
+
+class TestBatchEngine(unittest.TestCase):
+    def test_selection_semantics(self):
+        model = FrequencyModel(FREQUENCIES)
+        top = set(model.top(14))
+        bottom = set(model.bottom(5))
+        tickets = generate_ticket_batch(model, 2000, rng=np.random.default_rng(3))
+
+        self.assertEqual(tickets.shape, (2000, 6))
+        for row in tickets.tolist():
+            self.assertEqual(len(set(row)), 6)
+            self.assertTrue(set(row[:2]) <= top)
+            if any(n % 7 == 0 for n in bottom - set(row[:2])):
+                self.assertEqual(row[2] % 7, 0)
+
+
+    def test_multiple_of_seven_matches_scalar_path(self):
+        # Both paths pick the multiple of 7 uniformly among the candidates.
+        model = FrequencyModel(FREQUENCIES)
+        scalar = [build_pen_ticket(model)["numbers"][2] for _ in range(7000)]
+        batch = generate_ticket_batch(model, 7000, rng=np.random.default_rng(3))[:, 2].tolist()
+        for third in (scalar, batch):
+            counts = np.bincount([n for n in third if n % 7 == 0], minlength=50)[7::7]
+            self.assertLess(counts.max() / counts.min(), 1.3)
+
+
+class TestBatchRoute(unittest.TestCase):
+    def setUp(self):
+        self.client = create_app().test_client()
+
+    @patch('app.services.fetch_draw_frequencies')
+    def test_json_and_ndjson(self, mock_fetch):
+        mock_fetch.return_value = FrequencyModel(FREQUENCIES)
+        with patch('app.routes.get_lotto_jackpot', return_value=None):
+            response = self.client.get('/generate/batch?count=3')
+        self.assertEqual(len(response.get_json()['tickets']), 3)
+
+        response = self.client.get('/generate/batch?count=5000')
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        lines = response.get_data(as_text=True).splitlines()
+        self.assertEqual(len(lines), 5000)
+        self.assertEqual(len(json.loads(lines[0])['numbers']), 6)
+
+    def test_rejects_bad_count(self):
+        self.assertEqual(self.client.get('/generate/batch?count=0').status_code, 400)
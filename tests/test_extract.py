@@ -0,0 +1,20 @@
+import glob
+import os
+import unittest
+
+from app.extract import extract_draw_data, extract_fast, extract_with_soup
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+class TestExtract(unittest.TestCase):
+    def test_fast_matches_soup_on_fixtures(self):
+        for path in glob.glob(os.path.join(FIXTURE_DIR, '*.html')):
+            with open(path, encoding='utf-8') as f:
+                html_content = f.read()
+            with self.subTest(page=os.path.basename(path)):
+                self.assertEqual(extract_fast(html_content), extract_with_soup(html_content))
+
+    def test_missing_table_raises_after_fallback(self):
+        with self.assertRaises(ValueError):
+            extract_draw_data("<html><body>No table here</body></html>", backend="fast")
@@ -0,0 +1,22 @@
+import unittest
+
+from app.frequency_model import FrequencyModel
+from app.services import get_top_numbers
+
+
+class TestFrequencyModel(unittest.TestCase):
+    def setUp(self):
+        self.frequencies = {1: 100, 2: 80, 3: 100, 4: 40, 5: 20, 9: 80}
+        self.model = FrequencyModel(self.frequencies)
+
+    def test_matches_sorted_ranking(self):
+        for reverse in (True, False):
+            expected = [n for n, _ in sorted(self.frequencies.items(), key=lambda item: item[1], reverse=reverse)]
+            for k in range(len(expected) + 1):
+                self.assertEqual(get_top_numbers(self.model, k, reverse=reverse), expected[:k])
+
+    def test_mapping_interface(self):
+        self.assertEqual(dict(self.model), self.frequencies)
+        self.assertNotIn(6, self.model)
+        with self.assertRaises(KeyError):
+            self.model[6]
@@ -0,0 +1,109 @@
+import json
+import time
+import unittest
+from dataclasses import replace
+from unittest.mock import patch
+
+from app import create_app
+from app import services
+from app.batch import generate_ticket_batch
+from app.frequency_model import FrequencyModel
+from app.games import GAMES
+from app.schedule import IDLE_POLL_INTERVAL
+from app.snapshot import SnapshotCache, make_snapshot, parse_snapshot
+from app.upstream import UpstreamClient
+from benchmarks.upstream import serve_upstream
+from tests.test_snapshot import load_fixture
+
+DAILY_FREQUENCIES = {ball: 100 - ball for ball in range(1, 37)}
+
+
+class TestGames(unittest.TestCase):
+    def test_extraction_rules_select_the_game_balls(self):
+        game = GAMES["daily-lotto"]
+        html = load_fixture().replace("ball lotto ball", game.ball_class)
+        self.assertEqual(len(parse_snapshot(html, game.rules).frequencies), 49)
+        self.assertEqual(len(parse_snapshot(html).frequencies), 0)
+
+    def test_ticket_follows_game_shape(self):
+        game = GAMES["powerball"]
+        frequencies = FrequencyModel({ball: 100 - ball for ball in range(1, 51)})
+        for _ in range(50):
+            ticket = services.build_pen_ticket(frequencies, game)
+            self.assertEqual(len(set(ticket["numbers"])), game.pick_count)
+            self.assertTrue(1 <= ticket["bonus"] <= game.bonus_range)
+
+        tickets = generate_ticket_batch(FrequencyModel(DAILY_FREQUENCIES), 500, pick_count=5, range_=36)
+        self.assertEqual(tickets.shape, (500, 5))
+        self.assertTrue(all(len(set(row)) == 5 for row in tickets.tolist()))
+
+    def test_slow_game_does_not_hold_up_others(self):
+        def cache(delay):
+            def fetch():
+                time.sleep(delay)
+                return load_fixture()
+            return SnapshotCache(fetch, ttl=60, stale_while_revalidate=60)
+
+        caches = {"lotto": cache(0), "daily-lotto": cache(0), "powerball": cache(1.0)}
+        with patch.dict(services.game_caches, caches, clear=True):
+            started = time.perf_counter()
+            results = services.refresh_game_caches(timeout=0.3)
+            self.assertLess(time.perf_counter() - started, 0.9)
+            self.assertEqual(results, {"lotto": True, "daily-lotto": True, "powerball": None})
+            status = {item["game"]: item for item in services.get_games_status()}
+            self.assertFalse(status["lotto"]["stale"])
+            self.assertTrue(status["powerball"]["stale"])
+
+    def test_workers_adopt_each_others_polls(self):
+        with serve_upstream() as (url, server):
+            game = replace(GAMES["lotto"], key="shared-poll", url=url)
+            with patch.object(services, 'upstream_client', UpstreamClient(retries=0)):
+                leader, idle = services.make_game_cache(game), services.make_game_cache(game)
+                with patch.dict(services.game_caches, {"shared-poll": leader}, clear=True), \
+                        patch.dict(GAMES, {"shared-poll": game}):
+                    self.assertEqual(services.due_games(), ["shared-poll"])
+                    self.assertIsNotNone(leader.refresh())
+                with patch.dict(services.game_caches, {"shared-poll": idle}, clear=True), \
+                        patch.dict(GAMES, {"shared-poll": game}):
+                    # The idle worker has served nothing but sees the shared poll.
+                    self.assertEqual(services.due_games(), [])
+                    self.assertIs(idle.refresh(wait=True), idle.peek())
+                self.assertEqual(server.config.requests, 1)
+
+                # Once the game's poll interval has passed, the next poll fetches.
+                old = make_snapshot({1: 10}, None, fetched_at=time.time() - IDLE_POLL_INTERVAL)
+                leader.store.save(old)
+                later = services.make_game_cache(game)
+                self.assertNotEqual(later.refresh(wait=True).version, old.version)
+                self.assertEqual(server.config.requests, 2)
+
+
+class TestGameRoutes(unittest.TestCase):
+    def setUp(self):
+        self.client = create_app().test_client()
+
+    @patch('app.services.get_lotto_jackpot', return_value=None)
+    @patch('app.services.fetch_draw_frequencies')
+    def test_generate_game(self, mock_fetch, _):
+        mock_fetch.return_value = FrequencyModel(DAILY_FREQUENCIES)
+        data = self.client.get('/generate/daily-lotto').get_json()
+        self.assertEqual(data["game"], "daily-lotto")
+        self.assertEqual(len(data["numbers"]), 5)
+        mock_fetch.assert_called_with("daily-lotto")
+
+        self.assertEqual(self.client.get('/generate/keno').status_code, 404)
+
+    @patch('app.routes.get_lotto_jackpot', return_value=None)
+    @patch('app.services.fetch_draw_frequencies')
+    def test_batch_includes_bonus_ball(self, mock_fetch, _):
+        mock_fetch.return_value = FrequencyModel({ball: 100 - ball for ball in range(1, 51)})
+        data = self.client.get('/generate/batch?game=powerball&count=20').get_json()
+        self.assertEqual(len(data["tickets"]), 20)
+        self.assertEqual(len(data["bonus"]), 20)
+        self.assertTrue(all(1 <= ball <= 20 for ball in data["bonus"]))
+
+        response = self.client.get('/generate/batch?game=powerball&count=3',
+                                   headers={'Accept': 'application/x-ndjson'})
+        lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(all(len(line["numbers"]) == 5 and "bonus" in line for line in lines))
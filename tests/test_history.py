@@ -0,0 +1,40 @@
+import os
+import tempfile
+import unittest
+
+from app.history import FrequencyHistory
+from app.snapshot import make_snapshot
+
+
+def snapshot(counts, fetched_at):
+    return make_snapshot(dict(enumerate(counts, start=1)), None, fetched_at=fetched_at)
+
+
+class TestFrequencyHistory(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'history.bin')
+        self.history = FrequencyHistory(self.path, width=6)
+        self.history.append(snapshot([10, 10, 10, 10, 10, 10], 1.0))
+        self.history.append(snapshot([11, 10, 11, 10, 11, 10], 2.0))
+        self.history.append(snapshot([12, 10, 11, 11, 11, 11], 3.0))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_skips_unchanged_snapshots(self):
+        self.assertFalse(self.history.append(snapshot([12, 10, 11, 11, 11, 11], 4.0)))
+        self.assertEqual(len(self.history), 3)
+
+    def test_windows_and_trend(self):
+        self.assertEqual(self.history.window(1), {1: 1, 2: 0, 3: 0, 4: 1, 5: 0, 6: 1})
+        self.assertEqual(self.history.window(5), {1: 2, 2: 0, 3: 1, 4: 1, 5: 1, 6: 1})
+        self.assertEqual(self.history.window_since(2.0), self.history.window(1))
+        change = {item["ball"]: item["change"] for item in self.history.trend(1)}
+        self.assertEqual(change, {1: 0, 2: 0, 3: -1, 4: 1, 5: -1, 6: 1})
+
+    def test_other_process_sees_appends(self):
+        reader = FrequencyHistory(self.path)
+        self.assertEqual(len(reader), 3)
+        self.history.append(snapshot([13, 11, 11, 11, 11, 11], 5.0))
+        self.assertEqual(reader.window(1), {1: 1, 2: 1, 3: 0, 4: 0, 5: 0, 6: 0})
@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+from itertools import combinations
+from math import comb
+from unittest.mock import patch
+
+import numpy as np
+
+from app import services
+from app.frequency_model import FrequencyModel
+from app.issued import IssuedTickets, ticket_rank, ticket_ranks
+
+FREQUENCIES = {ball: 100 - ball for ball in range(1, 50)}
+
+
+class TestIssuedTickets(unittest.TestCase):
+    def test_rank_is_a_bijection(self):
+        ranks = {ticket_rank(ticket, 9) for ticket in combinations(range(1, 10), 4)}
+        self.assertEqual(ranks, set(range(comb(9, 4))))
+        self.assertEqual(ticket_rank([44, 45, 46, 47, 48, 49], 49), comb(49, 6) - 1)
+        self.assertIsNone(ticket_rank([1, 1, 2, 3, 4, 5], 49))
+        self.assertIsNone(ticket_rank([1, 2, 3, 4, 5, 50], 49))
+
+        tickets = [[6, 1, 2, 3, 4, 5], [49, 48, 47, 46, 45, 44], [1, 1, 2, 3, 4, 5]]
+        ranks, valid = ticket_ranks(np.array(tickets), 49)
+        self.assertEqual(ranks[:2].tolist(), [ticket_rank(ticket, 49) for ticket in tickets[:2]])
+        self.assertEqual(valid.tolist(), [True, True, False])
+
+    def test_collisions_reset_per_version(self):
+        issued = IssuedTickets(6)
+        self.assertTrue(issued.add([6, 5, 4, 3, 2, 1], "v1", 49))
+        self.assertFalse(issued.add([1, 2, 3, 4, 5, 6], "v1", 49))
+        stats = issued.stats()
+        self.assertEqual((stats["issued"], stats["collisions"]), (1, 1))
+        self.assertEqual(stats["memory_bytes"], (comb(49, 6) + 7) // 8)
+        self.assertTrue(issued.add([1, 2, 3, 4, 5, 6], "v2", 49))
+        self.assertEqual(issued.stats()["resets"], 1)
+
+    def test_generation_resamples_duplicates(self):
+        first = {"numbers": [1, 2, 3, 4, 5, 6], "reasons": []}
+        second = {"numbers": [1, 2, 3, 4, 5, 7], "reasons": []}
+        tracker = IssuedTickets(6)
+        with patch.dict(services.issued_tickets, {"lotto": tracker}), \
+                patch('app.services.build_pen_ticket', side_effect=[second]) as build:
+            self.assertIs(services.issue_unique_ticket(first, FREQUENCIES, "lotto"), first)
+            self.assertIs(services.issue_unique_ticket(first, FREQUENCIES, "lotto"), second)
+        self.assertEqual(build.call_count, 1)
+        self.assertEqual(tracker.stats()["collisions"], 1)
+
+    def test_workers_share_the_bitset(self):
+        path = os.path.join(tempfile.mkdtemp(), "issued-lotto.bin")
+        first, second = IssuedTickets(6, path), IssuedTickets(6, path)
+        self.assertTrue(first.add([1, 2, 3, 4, 5, 6], "v1", 49))
+        self.assertFalse(second.add([6, 5, 4, 3, 2, 1], "v1", 49))
+        self.assertEqual(first.stats()["collisions"], 1)
+        self.assertTrue(first.stats()["shared"])
+
+        # A new snapshot version clears the file for every worker.
+        self.assertTrue(second.add([1, 2, 3, 4, 5, 6], "v2", 49))
+        self.assertFalse(first.add([1, 2, 3, 4, 5, 6], "v2", 49))
+        self.assertEqual((first.stats()["issued"], first.stats()["resets"]), (1, 1))
+
+    def test_add_many_flags_repeats(self):
+        issued = IssuedTickets(6)
+        issued.add([1, 2, 3, 4, 5, 6], "v1", 49)
+        tickets = np.array([[6, 5, 4, 3, 2, 1], [1, 2, 3, 4, 5, 7], [7, 5, 4, 3, 2, 1], [1, 1, 2, 3, 4, 5]])
+        self.assertEqual(issued.add_many(tickets, "v1", 49).tolist(), [False, True, False, True])
+        self.assertFalse(issued.add([1, 2, 3, 4, 5, 7], "v1", 49))
+        self.assertEqual(issued.stats()["issued"], 2)
+
+    def test_batches_redraw_issued_tickets(self):
+        frequencies = FrequencyModel(FREQUENCIES)
+        with patch.dict(services.issued_tickets, {"lotto": IssuedTickets(6)}), \
+                patch('app.services.fetch_draw_frequencies', return_value=frequencies):
+            batches = [np.concatenate([chunk for chunk, _ in services.generate_pen_lotto_batch(5000)])
+                       for _ in range(2)]
+            rows = {tuple(sorted(row)) for row in np.concatenate(batches).tolist()}
+            self.assertEqual(len(rows), 10000)
+            self.assertEqual(services.issued_tickets["lotto"].stats()["issued"], 10000)
@@ -0,0 +1,26 @@
+import logging
+import queue
+import unittest
+
+from app.logging_config import DeferredQueueHandler, SamplingFilter
+
+
+class TestLoggingConfig(unittest.TestCase):
+    def test_sampling_keeps_warnings(self):
+        sampler = SamplingFilter(0)
+        info = logging.LogRecord('app.requests', logging.INFO, __file__, 1, 'hi', None, None)
+        warning = logging.LogRecord('app.requests', logging.WARNING, __file__, 1, 'hi', None, None)
+        self.assertFalse(sampler.filter(info))
+        self.assertTrue(sampler.filter(warning))
+
+    def test_queue_handler_defers_formatting(self):
+        log_queue = queue.SimpleQueue()
+        logger = logging.getLogger('tests.deferred')
+        logger.propagate = False
+        logger.addHandler(DeferredQueueHandler(log_queue))
+        logger.warning("Generated %d tickets", 3)
+
+        record = log_queue.get_nowait()
+        self.assertEqual(record.msg, "Generated %d tickets")
+        self.assertEqual(record.args, (3,))
+        self.assertEqual(record.getMessage(), "Generated 3 tickets")
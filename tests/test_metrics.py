@@ -0,0 +1,34 @@
+import unittest
+from unittest.mock import patch
+
+from app import create_app
+from app.metrics import STAGE_SECONDS, Counter, Histogram, render_metrics
+
+
+class TestMetrics(unittest.TestCase):
+    def test_prometheus_text(self):
+        counter = Counter("test_events_total", "Events.", ("kind",))
+        counter.inc(kind="a")
+        counter.inc(2, kind="a")
+        histogram = Histogram("test_seconds", "Durations.", buckets=(0.1, 1.0))
+        histogram.observe(0.5)
+
+        text = render_metrics()
+        self.assertIn('test_events_total{kind="a"} 3', text)
+        self.assertIn('test_seconds_bucket{le="0.1"} 0', text)
+        self.assertIn('test_seconds_bucket{le="1.0"} 1', text)
+        self.assertIn('test_seconds_bucket{le="+Inf"} 1', text)
+        self.assertIn('test_seconds_count 1', text)
+
+    @patch('app.services.get_lotto_jackpot', return_value=None)
+    @patch('app.services.fetch_draw_frequencies')
+    def test_generate_records_stages(self, mock_fetch, _):
+        mock_fetch.return_value = {1: 100, 2: 80, 3: 60, 4: 40, 5: 20}
+        client = create_app().test_client()
+        before = STAGE_SECONDS.count(stage="enforce_universal_balance")
+        client.get('/generate')
+        self.assertEqual(STAGE_SECONDS.count(stage="enforce_universal_balance"), before + 1)
+
+        response = client.get('/metrics')
+        self.assertEqual(response.mimetype, 'text/plain')
+        self.assertIn('lottoscope_stage_seconds_bucket{stage="jsonify"', response.get_data(as_text=True))
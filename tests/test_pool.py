@@ -0,0 +1,49 @@
+import time
+import unittest
+from unittest.mock import patch
+
+from app import services
+from app.metrics import SNAPSHOT_CACHE_REQUESTS, STAGE_SECONDS
+from app.pool import TicketPool
+from app.snapshot import make_snapshot
+
+
+class TestTicketPool(unittest.TestCase):
+    def setUp(self):
+        self.snapshot = make_snapshot({1: 10, 2: 20}, None)
+        self.pool = TicketPool(lambda: self.snapshot, lambda freqs: {"numbers": sorted(freqs)},
+                               capacity=8, poll_interval=0.01)
+
+    def wait_for_fill(self):
+        deadline = time.time() + 2
+        while self.pool.stats()["fill"] < self.pool.capacity and time.time() < deadline:
+            time.sleep(0.01)
+
+    def test_underflow_then_hit(self):
+        self.assertIsNone(self.pool.pop(self.snapshot.version))
+        self.assertEqual(self.pool.stats()["underflows"], 1)
+
+        self.pool.start()
+        self.wait_for_fill()
+        self.assertEqual(self.pool.pop(self.snapshot.version), {"numbers": [1, 2]})
+        self.assertEqual(self.pool.stats()["hits"], 1)
+
+    def test_snapshot_change_invalidates(self):
+        self.pool.start()
+        self.wait_for_fill()
+        self.snapshot = make_snapshot({3: 30}, None)
+        self.pool.pop(self.snapshot.version)
+        self.wait_for_fill()
+        self.assertEqual(self.pool.pop(self.snapshot.version), {"numbers": [3]})
+        self.assertGreaterEqual(self.pool.stats()["invalidations"], 1)
+
+    def test_service_producer_leaves_request_metrics_alone(self):
+        snapshot = make_snapshot({ball: 100 - ball for ball in range(1, 50)}, None)
+        pool = TicketPool(services.snapshot_cache.peek, services._build_pooled_ticket, capacity=8)
+        hits = SNAPSHOT_CACHE_REQUESTS.value(result="hit")
+        timings = STAGE_SECONDS.count(stage="lucky_echo_bias")
+        with patch.object(services.snapshot_cache, '_snapshot', snapshot):
+            self.assertTrue(pool._fill_once())
+        self.assertEqual(pool.stats()["fill"], 8)
+        self.assertEqual(SNAPSHOT_CACHE_REQUESTS.value(result="hit"), hits)
+        self.assertEqual(STAGE_SECONDS.count(stage="lucky_echo_bias"), timings)
@@ -0,0 +1,92 @@
+import gzip
+import json
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from app import create_app, routes, services
+from app.fun_facts import FUN_FACTS
+from app.responses import HOME_DISCLAIMER, HOME_TITLE, dumps
+from app.snapshot import make_snapshot, parse_snapshot
+from tests.test_snapshot import load_fixture
+
+
+class TestResponses(unittest.TestCase):
+    def setUp(self):
+        self.client = create_app().test_client()
+
+    def test_dumps_handles_numpy(self):
+        self.assertEqual(json.loads(dumps({"numbers": np.arange(1, 4)})), {"numbers": [1, 2, 3]})
+
+    def test_home_is_spliced_from_static_pieces(self):
+        response = self.client.get('/')
+        self.assertNotIn('Content-Encoding', response.headers)
+        data = response.get_json()
+        self.assertEqual(data["title"], HOME_TITLE)
+        self.assertEqual(data["disclaimer"], HOME_DISCLAIMER)
+        self.assertIn(data["fun_fact"], FUN_FACTS)
+
+    def test_gzip_negotiation(self):
+        response = self.client.get('/', headers={'Accept-Encoding': 'gzip, deflate'})
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response.headers['Vary'])
+        self.assertIn(json.loads(gzip.decompress(response.data))["fun_fact"], FUN_FACTS)
+
+        response = self.client.get('/', headers={'Accept-Encoding': 'gzip;q=0'})
+        self.assertNotIn('Content-Encoding', response.headers)
+
+    @patch('app.services.get_lotto_jackpot', return_value="R 63 Million")
+    @patch('app.services.fetch_draw_frequencies')
+    def test_generate_is_compressed(self, mock_fetch, _):
+        mock_fetch.return_value = {ball: 100 - ball for ball in range(1, 50)}
+        response = self.client.get('/generate', headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(len(json.loads(gzip.decompress(response.data))["numbers"]), 6)
+
+
+class TestSeededResponses(unittest.TestCase):
+    def setUp(self):
+        self.client = create_app().test_client()
+        self.snapshot = parse_snapshot(load_fixture())
+        routes.seeded_responses.clear()
+
+    def get(self, url, **kwargs):
+        with patch.object(services.snapshot_cache, 'get', return_value=self.snapshot):
+            return self.client.get(url, **kwargs)
+
+    def test_same_seed_same_ticket(self):
+        first = self.get('/generate?seed=abc')
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.get_json()["snapshot"], self.snapshot.version)
+        self.assertIn('max-age', first.headers['Cache-Control'])
+        routes.seeded_responses.clear()
+        second = self.get('/generate?seed=abc')
+        self.assertEqual(first.get_json(), second.get_json())
+        self.assertEqual(first.headers['ETag'], second.headers['ETag'])
+        self.assertNotEqual(self.get('/generate?seed=abd').headers['ETag'], first.headers['ETag'])
+
+    def test_conditional_request_and_snapshot_change(self):
+        etag = self.get('/generate?seed=abc').headers['ETag']
+        self.assertEqual(len(routes.seeded_responses['lotto']), 1)
+        response = self.get('/generate?seed=abc', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b'')
+
+        self.snapshot = make_snapshot({ball: ball for ball in range(1, 50)}, "R 1 Million")
+        response = self.get('/generate?seed=abc', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+        self.assertEqual(len(routes.seeded_responses['lotto']), 1)
+
+    def test_refresh_between_reads_cannot_mix_snapshots(self):
+        newer = make_snapshot({ball: ball for ball in range(1, 50)}, "R 1 Million")
+        with patch('app.services.get_draw_snapshot', return_value=self.snapshot):
+            expected = services.generate_pen_lotto_numbers(seed="abc")
+        with patch('app.services.get_draw_snapshot', side_effect=[self.snapshot, newer]):
+            result = services.generate_pen_lotto_numbers(seed="abc")
+        self.assertEqual(result["snapshot"], self.snapshot.version)
+        self.assertEqual(result, expected)
+
+    def test_rejects_long_seed(self):
+        self.assertEqual(self.get('/generate?seed=' + 'x' * 65).status_code, 400)
@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+
+from app.shared_cache import SharedSnapshotStore, deserialize_snapshot, serialize_snapshot
+from app.snapshot import SnapshotCache, make_snapshot
+from tests.test_snapshot import load_fixture
+
+
+class TestSharedSnapshotStore(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'snapshot.json')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_second_worker_adopts_shared_snapshot(self):
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return load_fixture()
+
+        leader = SnapshotCache(fetch, store=SharedSnapshotStore(self.path))
+        follower = SnapshotCache(fetch, store=SharedSnapshotStore(self.path))
+
+        first = leader.get()
+        second = follower.get()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(first.version, second.version)
+        self.assertEqual(dict(first.frequencies), dict(second.frequencies))
+
+    def test_only_one_leader(self):
+        store = SharedSnapshotStore(self.path)
+        with store.leader() as first:
+            with SharedSnapshotStore(self.path).leader() as second:
+                self.assertTrue(first)
+                self.assertFalse(second)
+
+    def test_binary_round_trip(self):
+        for jackpot in ("R 63 Million", None):
+            snapshot = make_snapshot({1: 120, 7: 95, 52: 200}, jackpot, fetched_at=1234.5)
+            restored = deserialize_snapshot(serialize_snapshot(snapshot))
+            self.assertEqual(restored, snapshot)
+
+    def test_warm_start_skips_upstream(self):
+        SharedSnapshotStore(self.path).save(make_snapshot({1: 10, 2: 20}, "R 1"))
+        cache = SnapshotCache(lambda: self.fail("upstream fetched"), store=SharedSnapshotStore(self.path))
+        self.assertEqual(cache.warm().jackpot, "R 1")
+        self.assertEqual(cache.get().jackpot, "R 1")
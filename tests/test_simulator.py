@@ -0,0 +1,57 @@
+import threading
+import unittest
+
+import numpy as np
+
+from app import create_app
+from app.frequency_model import FrequencyModel
+from app.services import SIMULATION_MAX_TICKETS, simulation_slots
+from app.simulator import match_counts, simulate, weighted_draws
+
+FREQUENCIES = {ball: 100 + (ball * 37) % 61 for ball in range(1, 50)}
+
+
+class TestSimulator(unittest.TestCase):
+    def test_weighted_draws_are_unique(self):
+        draws = weighted_draws(FrequencyModel(FREQUENCIES), 500, np.random.default_rng(0))
+        self.assertEqual(draws.shape, (500, 6))
+        self.assertTrue(all(len(set(row)) == 6 for row in draws.tolist()))
+
+    def test_match_counts(self):
+        tickets = np.array([[1, 2, 3, 4, 5, 6], [1, 2, 3, 4, 5, 6]])
+        draws = np.array([[1, 2, 3, 4, 5, 6], [7, 8, 9, 10, 11, 1]])
+        self.assertEqual(match_counts(tickets, draws).tolist(), [0, 1, 0, 0, 0, 0, 1])
+
+    def test_seeded_runs_are_reproducible(self):
+        progress = []
+        first = simulate(FREQUENCIES, 5000, workers=1, seed=7, task_size=2000, progress=progress.append)
+        second = simulate(FREQUENCIES, 5000, workers=1, seed=7, task_size=2000)
+        self.assertEqual(first["matches"], second["matches"])
+        self.assertEqual(first["simulated"], 5000)
+        self.assertEqual(len(progress), 3)
+
+    def test_seed_is_independent_of_worker_count(self):
+        serial = simulate(FREQUENCIES, 5000, workers=1, seed=11, task_size=2000)
+        parallel = simulate(FREQUENCIES, 5000, workers=2, seed=11, task_size=2000)
+        self.assertEqual(serial["matches"], parallel["matches"])
+        self.assertEqual(parallel["simulated"], 5000)
+
+    def test_cancel(self):
+        cancel = threading.Event()
+        cancel.set()
+        result = simulate(FREQUENCIES, 5000, workers=1, seed=7, task_size=2000, cancel=cancel)
+        self.assertTrue(result["cancelled"])
+        self.assertEqual(result["simulated"], 0)
+
+
+class TestSimulateRoute(unittest.TestCase):
+    def setUp(self):
+        self.client = create_app().test_client()
+
+    def test_limits(self):
+        self.assertEqual(self.client.get(f'/simulate?tickets={SIMULATION_MAX_TICKETS + 1}').status_code, 400)
+        self.assertTrue(simulation_slots.acquire(blocking=False))
+        try:
+            self.assertEqual(self.client.get('/simulate?tickets=10').status_code, 429)
+        finally:
+            simulation_slots.release()
@@ -0,0 +1,38 @@
+import os
+import time
+import unittest
+
+from app.snapshot import SnapshotCache, make_snapshot, parse_snapshot
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), 'fixtures', 'hot_numbers.html')
+
+
+def load_fixture():
+    with open(FIXTURE_PATH, encoding='utf-8') as f:
+        return f.read()
+
+
+class TestSnapshot(unittest.TestCase):
+    def test_parse_snapshot(self):
+        snapshot = parse_snapshot(load_fixture())
+        self.assertEqual(len(snapshot.frequencies), 49)
+        self.assertEqual(snapshot.jackpot, "R 63 Million")
+        self.assertTrue(snapshot.version)
+
+    def test_fetches_once_while_fresh(self):
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return load_fixture()
+
+        cache = SnapshotCache(fetch, ttl=60, stale_while_revalidate=60)
+        first = cache.get()
+        self.assertIs(cache.get(), first)
+        self.assertEqual(len(calls), 1)
+
+    def test_serves_stale_snapshot_on_failed_refresh(self):
+        cache = SnapshotCache(lambda: None, ttl=0, stale_while_revalidate=0)
+        stale = make_snapshot({1: 10}, None, fetched_at=time.time() - 3600)
+        cache.set(stale)
+        self.assertIs(cache.get(), stale)
@@ -0,0 +1,82 @@
+import unittest
+from dataclasses import replace
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from app import services
+from app.games import GAMES
+from app.schedule import (DRAW_POLL_INTERVAL, DRAW_TIMEZONE, IDLE_POLL_INTERVAL, next_refresh_delay,
+                          refresh_due)
+from app.snapshot import NOT_MODIFIED, SnapshotCache, make_snapshot
+from app.upstream import UpstreamClient
+from benchmarks.upstream import serve_upstream
+
+
+class TestUpstreamClient(unittest.TestCase):
+    def test_conditional_get_returns_not_modified(self):
+        with serve_upstream() as (url, server):
+            client = UpstreamClient(retries=0)
+            with patch.object(server.config, 'etag', '"v1"'):
+                self.assertIn('tableCell', client.fetch(url))
+                client.commit_validators(url)
+                self.assertIs(client.fetch(url), NOT_MODIFIED)
+                self.assertIn('tableCell', client.fetch(url, conditional=False))
+
+    def test_retries_server_errors(self):
+        with serve_upstream(error_rate=1.0) as (url, server):
+            client = UpstreamClient(retries=2, backoff_base=0.001)
+            self.assertIsNone(client.fetch(url))
+            self.assertEqual(server.config.requests, 3)
+
+    def test_failed_parse_is_not_revalidated(self):
+        with serve_upstream(etag='"v1"') as (url, server):
+            with patch.object(services, 'upstream_client', UpstreamClient(retries=0)):
+                cache = services.make_game_cache(replace(GAMES["lotto"], key="validators", url=url))
+                old = make_snapshot({1: 10}, "R 1", fetched_at=0)
+                cache.set(old)
+                with patch('app.snapshot.parse_snapshot', side_effect=ValueError("bad page")):
+                    self.assertIsNone(cache.refresh())
+                self.assertEqual(cache.consecutive_failures, 1)
+
+                # The next poll downloads and parses the page again instead of
+                # getting a 304 that would restamp the old snapshot.
+                snapshot = cache.refresh()
+                self.assertNotEqual(snapshot.version, old.version)
+                self.assertEqual(cache.consecutive_failures, 0)
+                self.assertIs(services.upstream_client.fetch(url), NOT_MODIFIED)
+                self.assertEqual(server.config.requests, 3)
+
+    def test_not_modified_renews_snapshot_without_parsing(self):
+        old = make_snapshot({1: 10}, "R 1", fetched_at=0)
+        cache = SnapshotCache(lambda: NOT_MODIFIED, ttl=60)
+        cache.set(old)
+        renewed = cache.refresh()
+        self.assertEqual(renewed.version, old.version)
+        self.assertGreater(renewed.fetched_at, old.fetched_at)
+
+
+class TestDrawSchedule(unittest.TestCase):
+    def test_polls_often_after_draw(self):
+        after_draw = datetime(2026, 10, 14, 21, 30, tzinfo=DRAW_TIMEZONE)  # Wednesday
+        self.assertAlmostEqual(next_refresh_delay(after_draw, jitter=0), DRAW_POLL_INTERVAL)
+
+    def test_polls_rarely_between_draws(self):
+        monday = datetime(2026, 10, 12, 9, 0, tzinfo=DRAW_TIMEZONE)
+        self.assertAlmostEqual(next_refresh_delay(monday, jitter=0), IDLE_POLL_INTERVAL)
+
+    def test_idle_poll_lands_on_next_draw(self):
+        draw = datetime(2026, 10, 17, 20, 57, tzinfo=DRAW_TIMEZONE)  # Saturday
+        before = draw - timedelta(minutes=30)
+        self.assertAlmostEqual(next_refresh_delay(before, jitter=0), 1800)
+
+    def test_games_follow_their_own_draws(self):
+        friday = datetime(2026, 10, 16, 21, 30, tzinfo=DRAW_TIMEZONE)  # after the PowerBall draw
+        self.assertAlmostEqual(next_refresh_delay(friday, jitter=0, draw_times=GAMES["powerball"].draw_times),
+                               DRAW_POLL_INTERVAL)
+        self.assertAlmostEqual(next_refresh_delay(friday, jitter=0, draw_times=GAMES["lotto"].draw_times),
+                               IDLE_POLL_INTERVAL)
+
+        fetched_before_draw = (friday - timedelta(hours=1)).timestamp()
+        self.assertTrue(refresh_due(fetched_before_draw, friday, draw_times=GAMES["daily-lotto"].draw_times))
+        self.assertFalse(refresh_due(fetched_before_draw, friday, draw_times=GAMES["lotto"].draw_times))
+        self.assertTrue(refresh_due(None, friday))